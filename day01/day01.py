@@ -1,8 +1,11 @@
 """Day 01."""
 
-from typing import Any, Iterator, Sequence, TextIO
+import re
+from typing import Any, BinaryIO, Iterator
 
-from utils.parse import read_lines
+from utils.parse import Buffer, iter_line_chunks, map_input
+
+INPUT_MODE = "bytes"
 
 words_to_numbers = {
     "one": "1",
@@ -16,48 +19,51 @@ words_to_numbers = {
     "nine": "9",
 }
 
-
-def is_word(s: Sequence[str], index: int, word: str) -> bool:
-    """Check if the provided index in the string is the start of the provided word."""
-    for offset, char in enumerate(word):
-        if index + offset >= len(s) or s[index + offset] != char:
-            return False
-    return True
+token_values = {str(n).encode(): n for n in range(10)} | {
+    word.encode(): int(digit) for word, digit in words_to_numbers.items()
+}
 
 
-def first_digit(s: Sequence[str], forward: bool, check_words: bool) -> str:
-    """Find the first digit in a string, moving front to back or back to front.
+def compile_scanners(tokens: list[str]) -> tuple[re.Pattern, re.Pattern]:
+    """Compile patterns finding the first and the last token on every line.
 
-    If check_words is true, also looks for numbers written as words.
+    Each pattern matches exactly once per non-empty line, capturing nothing when a
+    line has no token, so the results of the two line up. The first token is found
+    by a lazy scan from the start of the line, and the last by a greedy scan that
+    backs off from the end, which handles overlapping words like "twone".
     """
-    if forward:
-        r = range(len(s))
-    else:
-        r = range(len(s) - 1, -1, -1)
-    for i in r:
-        if s[i].isdigit():
-            return s[i]
-        if check_words:
-            for word, val in words_to_numbers.items():
-                if is_word(s, i, word):
-                    return val
-    raise ValueError(f"Failed to find a number in string {s}")
-
+    alternatives = b"|".join(re.escape(token.encode()) for token in tokens)
+    first = re.compile(rb"^(?:[^\n]*?(" + alternatives + rb")|[^\n]+)", re.MULTILINE)
+    last = re.compile(rb"^(?:[^\n]*(" + alternatives + rb")|[^\n]+)", re.MULTILINE)
+    return first, last
 
-# def first_digit(s: Iterable[str]) -> str:
-#     return next(dropwhile(lambda x: not x.isdigit(), s))
 
+digit_scanners = compile_scanners([str(n) for n in range(10)])
+word_scanners = compile_scanners([str(n) for n in range(10)] + list(words_to_numbers))
 
-def get_calibration_code(s: str, check_words: bool) -> int:
-    first_number = first_digit(s, True, check_words)
-    last_number = first_digit(s, False, check_words)
 
-    return int(first_number + last_number)
+def sum_calibration_codes(
+    buffer: Buffer, scanners: tuple[re.Pattern, re.Pattern]
+) -> int:
+    """Sum the two digit numbers made from the first and last token on every line.
 
-
-def run(file: TextIO) -> Iterator[Any]:
+    The buffer is scanned a chunk at a time, so the matches for a huge document
+    never need to be held in memory at once.
+    """
+    first, last = scanners
+    total = 0
+    for start, end in iter_line_chunks(buffer):
+        first_tokens = first.findall(buffer, start, end)
+        if b"" in first_tokens:
+            raise ValueError("Failed to find a number on a line")
+        last_tokens = last.findall(buffer, start, end)
+        total += 10 * sum(map(token_values.__getitem__, first_tokens))
+        total += sum(map(token_values.__getitem__, last_tokens))
+    return total
+
+
+def run(file: BinaryIO) -> Iterator[Any]:
     """Solution for Day 01."""
-    lines = list(read_lines(file))
-
-    yield sum(get_calibration_code(line, False) for line in lines)
-    yield sum(get_calibration_code(line, True) for line in lines)
+    with map_input(file) as buffer:
+        yield sum_calibration_codes(buffer, digit_scanners)
+        yield sum_calibration_codes(buffer, word_scanners)
@@ -0,0 +1,17 @@
+"""Synthetic input generator for Day 01."""
+
+from random import Random
+
+from day01.day01 import words_to_numbers
+
+
+def generate(scale: int, rng: Random) -> str:
+    """Generate a calibration document with scale lines."""
+    tokens = list("abcdefghijklmnopqrstuvwxyz") + list(words_to_numbers)
+    lines = []
+    for _ in range(scale):
+        parts = [rng.choice(tokens) for _ in range(rng.randint(2, 8))]
+        # Part 1 needs at least one digit on every line
+        parts.insert(rng.randint(0, len(parts)), str(rng.randint(1, 9)))
+        lines.append("".join(parts))
+    return "\n".join(lines) + "\n"
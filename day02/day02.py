@@ -1,12 +1,16 @@
 """Day 02."""
 
-from collections import Counter
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from enum import Enum
-from math import prod
-from typing import Any, Iterator, TextIO
+from typing import Any, BinaryIO, Iterable, Iterator, Mapping
 
-from utils.parse import read_lines
+from utils.parse import read_chunked_lines
+
+INPUT_MODE = "bytes"
+
+# How many (bag, game) pairs to compare at once, which bounds the memory used
+QUERY_BLOCK_CELLS = 1 << 22
 
 
 class Cube(Enum):
@@ -17,43 +21,93 @@ class Cube(Enum):
     GREEN = "green"
 
 
-@dataclass
-class Game:
-    """A class representing a game."""
+CUBE_NAMES = {cube.value.encode(): cube for cube in Cube}
 
-    game_id: int
-    turns: list[Counter[Cube]]
 
+@dataclass
+class GameTable:
+    """The most cubes of each colour shown in each game, stored by column."""
+
+    game_ids: array = field(default_factory=lambda: array("q"))
+    maxima: dict[Cube, array] = field(
+        default_factory=lambda: {cube: array("q") for cube in Cube}
+    )
+
+    @staticmethod
+    def from_lines(lines: Iterable[bytes]) -> "GameTable":
+        """Parse a game log, keeping only the maximum of each colour per game."""
+        table = GameTable()
+        for line in lines:
+            if not line:
+                continue
+            game, _, turns = line.partition(b": ")
+            table.game_ids.append(int(game.removeprefix(b"Game ")))
+            most = dict.fromkeys(CUBE_NAMES, 0)
+            # Which turn a cube was shown in doesn't matter, only the most of each
+            for cube in turns.replace(b";", b",").split(b", "):
+                number, color = cube.split(b" ")
+                most[color] = max(most[color], int(number))
+            for name, cube in CUBE_NAMES.items():
+                table.maxima[cube].append(most[name])
+        return table
+
+    def possible_id_sum(self, limit: Mapping[Cube, int]) -> int:
+        """Sum the ids of the games that could be played with a bag of cubes."""
+        red = limit.get(Cube.RED, 0)
+        green = limit.get(Cube.GREEN, 0)
+        blue = limit.get(Cube.BLUE, 0)
+        return sum(
+            game_id
+            for game_id, r, g, b in zip(
+                self.game_ids,
+                self.maxima[Cube.RED],
+                self.maxima[Cube.GREEN],
+                self.maxima[Cube.BLUE],
+            )
+            if r <= red and g <= green and b <= blue
+        )
 
-def parse_game(line: str) -> Game:
-    """Parse a game of cubes."""
-    game, turns = line.split(": ")
-    game_id = int(game.removeprefix("Game "))
-    turn_list = []
-    for turn in turns.split("; "):
-        turn_dict = Counter[Cube]()
-        for cube in turn.split(", "):
-            number, color = cube.split(" ")
-            turn_dict[Cube(color)] = int(number)
-        turn_list.append(turn_dict)
-    return Game(game_id, turn_list)
+    def possible_id_sums(self, limits: list[Mapping[Cube, int]]) -> list[int]:
+        """Sum the ids of the possible games for each of many bags of cubes.
 
+        With NumPy, every game is compared against a block of bags at once.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return [self.possible_id_sum(limit) for limit in limits]
 
-def run(file: TextIO) -> Iterator[Any]:
-    """Solution for Day 02."""
-    part_1_guess = Counter({Cube.RED: 12, Cube.GREEN: 13, Cube.BLUE: 14})
-    part_1_total = 0
-    part_2_total = 0
-
-    for line in read_lines(file):
-        game = parse_game(line)
+        game_ids = np.frombuffer(self.game_ids, dtype=np.int64)
+        maxima = np.stack(
+            [np.frombuffer(self.maxima[cube], dtype=np.int64) for cube in Cube]
+        )
+        bags = np.array(
+            [[limit.get(cube, 0) for cube in Cube] for limit in limits],
+            dtype=np.int64,
+        ).reshape(-1, len(Cube))
+
+        block_size = max(QUERY_BLOCK_CELLS // max(len(game_ids), 1), 1)
+        sums = []
+        for start in range(0, len(bags), block_size):
+            block = bags[start : start + block_size]
+            possible = (maxima[None, :, :] <= block[:, :, None]).all(axis=1)
+            sums.extend(int(total) for total in possible @ game_ids)
+        return sums
+
+    def power_sum(self) -> int:
+        """Sum the product of the fewest cubes of each colour that allow each game."""
+        return sum(
+            r * g * b
+            for r, g, b in zip(
+                self.maxima[Cube.RED], self.maxima[Cube.GREEN], self.maxima[Cube.BLUE]
+            )
+        )
 
-        if all(turn <= part_1_guess for turn in game.turns):
-            part_1_total += game.game_id
 
-        part_2_total += prod(
-            [max(turn.get(cube, 0) for turn in game.turns) for cube in Cube]
-        )
+def run(file: BinaryIO) -> Iterator[Any]:
+    """Solution for Day 02."""
+    part_1_guess = {Cube.RED: 12, Cube.GREEN: 13, Cube.BLUE: 14}
+    table = GameTable.from_lines(read_chunked_lines(file))
 
-    yield part_1_total
-    yield part_2_total
+    yield table.possible_id_sum(part_1_guess)
+    yield table.power_sum()
@@ -0,0 +1,15 @@
+"""Synthetic input generator for Day 02."""
+
+from random import Random
+
+
+def generate(scale: int, rng: Random) -> str:
+    """Generate a game log with scale games."""
+    lines = []
+    for game_id in range(1, scale + 1):
+        turns = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            turns.append(", ".join(f"{rng.randint(1, 15)} {color}" for color in colors))
+        lines.append(f"Game {game_id}: " + "; ".join(turns))
+    return "\n".join(lines) + "\n"
@@ -1,78 +1,96 @@
 """Day 03."""
 
-from itertools import islice, takewhile
-from typing import Any, Iterator, TextIO
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Iterable, Iterator
 
-from utils.parse import read_lines
+from utils.parse import read_chunked_lines
 
+INPUT_MODE = "bytes"
 
-class EnginePart:
-    """A class representing an engine part."""
+NUMBER_PATTERN = re.compile(rb"\d+")
+GEAR_PATTERN = re.compile(rb"\*")
+# Maps symbols to 1 and everything else to 0
+SYMBOL_TABLE = bytes(int(c not in b"0123456789.") for c in range(256))
 
-    def __init__(self, number: str, start_position: tuple[int, int]) -> None:
-        """Initialize with a number and position."""
-        self.length = len(number)
-        self.value = int(number)
-        self.col, self.row = start_position
 
-    def is_touching_symbol(self, symbols: dict[tuple[int, int], str]) -> bool:
-        """Check if the part is touching a symbol."""
-        for x_offset in range(-1, self.length + 1):
-            for y_offset in range(-1, 2):
-                if (self.col + y_offset, self.row + x_offset) in symbols:
-                    return True
-        return False
+@dataclass
+class Row:
+    """The numbers, symbols and gears on one row of a schematic."""
 
+    starts: list[int]
+    ends: list[int]
+    values: list[int]
+    symbol_mask: bytes
+    gears: list[int]
 
-def read_number(s: Iterator[str]) -> str:
-    """Read a number from an index in a string."""
-    return "".join(takewhile(lambda c: c.isdigit(), s))
+    @staticmethod
+    def parse(line: bytes) -> "Row":
+        """Parse a row of a schematic."""
+        starts, ends, values = [], [], []
+        for match in NUMBER_PATTERN.finditer(line):
+            starts.append(match.start())
+            ends.append(match.end())
+            values.append(int(match[0]))
+        gears = [match.start() for match in GEAR_PATTERN.finditer(line)]
+        return Row(starts, ends, values, line.translate(SYMBOL_TABLE), gears)
 
+    def has_symbol(self, start: int, end: int) -> bool:
+        """Check if there's a symbol between two columns."""
+        return 1 in self.symbol_mask[max(start, 0) : end]
 
-def find_adjacent_parts(
-    location: tuple[int, int], part_locations: dict[tuple[int, int], EnginePart]
-) -> list[EnginePart]:
-    """Get a list of numbers adjacent to a space."""
-    col, row = location
-    adjacent_parts = set()
-    for x_offset in range(-1, 2):
-        for y_offset in range(-1, 2):
-            part = part_locations.get((col + y_offset, row + x_offset))
-            if part is not None:
-                adjacent_parts.add(part)
+    def numbers_touching(self, col: int) -> list[int]:
+        """Get the numbers in the row that touch a column or either side of it."""
+        numbers = []
+        i = bisect_right(self.starts, col + 1) - 1
+        while i >= 0 and self.ends[i] >= col:
+            numbers.append(self.values[i])
+            i -= 1
+        return numbers
 
-    return list(adjacent_parts)
 
+EMPTY_ROW = Row([], [], [], b"", [])
 
-def run(file: TextIO) -> Iterator[Any]:
-    """Solution for Day 03."""
-    part_locations = {}
-    parts = []
-    symbols = {}
-    for col, line in enumerate(read_lines(file)):
-        i = 0
-        while i < len(line):
-            if line[i].isdigit():
-                num = read_number(islice(line, i, None))
-                part = EnginePart(num, (col, i))
-                parts.append(part)
-                for x_offset in range(part.length):
-                    part_locations[(col, i + x_offset)] = part
-                i += len(num) - 1
-            elif line[i] != ".":
-                symbols[(col, i)] = line[i]
-            i += 1
 
-    part_1_total = 0
-    for part in parts:
-        if part.is_touching_symbol(symbols):
-            part_1_total += part.value
-    yield part_1_total
+def row_totals(above: Row, row: Row, below: Row) -> tuple[int, int]:
+    """Sum the part numbers and gear ratios on a row, given the rows around it."""
+    part_total = 0
+    for start, end, value in zip(row.starts, row.ends, row.values):
+        if any(r.has_symbol(start - 1, end + 1) for r in (above, row, below)):
+            part_total += value
+
+    gear_total = 0
+    for col in row.gears:
+        numbers = [n for r in (above, row, below) for n in r.numbers_touching(col)]
+        if len(numbers) == 2:
+            gear_total += numbers[0] * numbers[1]
+    return part_total, gear_total
+
+
+def iter_row_totals(lines: Iterable[bytes]) -> Iterator[tuple[int, int]]:
+    """Sum the part numbers and gear ratios of each row of a schematic.
 
+    Only three rows are held at a time, and each row's totals are yielded as soon as
+    the row below it has been read.
+    """
+    above, row = EMPTY_ROW, None
+    for line in lines:
+        below = Row.parse(line)
+        if row is not None:
+            yield row_totals(above, row, below)
+            above = row
+        row = below
+    if row is not None:
+        yield row_totals(above, row, EMPTY_ROW)
+
+
+def run(file: BinaryIO) -> Iterator[Any]:
+    """Solution for Day 03."""
+    part_1_total = 0
     part_2_total = 0
-    for location, symbol in symbols.items():
-        if symbol == "*":
-            adjacent_numbers = find_adjacent_parts(location, part_locations)
-            if len(adjacent_numbers) == 2:
-                part_2_total += adjacent_numbers[0].value * adjacent_numbers[1].value
+    for part_total, gear_total in iter_row_totals(read_chunked_lines(file)):
+        part_1_total += part_total
+        part_2_total += gear_total
+    yield part_1_total
     yield part_2_total
@@ -0,0 +1,25 @@
+"""Synthetic input generator for Day 03."""
+
+from math import isqrt
+from random import Random
+
+SYMBOLS = "*#+$/@=%&-"
+
+
+def generate(scale: int, rng: Random) -> str:
+    """Generate a square schematic of about scale cells."""
+    side = isqrt(scale)
+    rows = []
+    for _ in range(side):
+        row = []
+        while len(row) < side:
+            roll = rng.random()
+            if roll < 0.1:
+                row.extend(str(rng.randint(1, 999)))
+                row.append(".")
+            elif roll < 0.15:
+                row.append(rng.choice(SYMBOLS))
+            else:
+                row.append(".")
+        rows.append("".join(row[:side]))
+    return "\n".join(rows) + "\n"
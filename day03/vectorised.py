@@ -0,0 +1,124 @@
+"""Day 03, solved with whole-grid NumPy operations instead of per-cell Python.
+
+Compare it against the streaming solution with python driver.py diff 3 vectorised.
+"""
+
+from io import BytesIO
+from typing import Any, BinaryIO, Iterator
+
+import numpy as np
+
+from day03.day03 import run as run_streaming
+from utils.parse import map_input
+
+INPUT_MODE = "bytes"
+
+NEIGHBOURS = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1)]
+# Every number with this many digits fits in an int64
+MAX_DIGITS = 18
+
+
+def read_schematic(file: BinaryIO) -> bytes:
+    """Read a schematic, with every line ending in a newline."""
+    with map_input(file) as buffer:
+        data = bytes(buffer).replace(b"\r", b"")
+    if not data.endswith(b"\n"):
+        data += b"\n"
+    return data
+
+
+def read_grid(data: bytes) -> np.ndarray | None:
+    """Turn a schematic into a 2D array of bytes with a border of dots around it.
+
+    Returns None unless every row has the same (non-zero) length, including when
+    there are blank lines.
+    """
+    width = data.index(b"\n")
+    height, remainder = divmod(len(data), width + 1)
+    if width == 0 or remainder or data[width :: width + 1] != b"\n" * height:
+        return None
+    grid = np.frombuffer(data, dtype=np.uint8).reshape(height, width + 1)[:, :width]
+    return np.pad(grid, 1, constant_values=ord("."))
+
+
+def neighbourhood(array: np.ndarray) -> list[np.ndarray]:
+    """Get the 3x3 neighbourhood of every inner cell, as one shifted view per offset."""
+    height, width = array.shape
+    return [
+        array[1 + dy : height - 1 + dy, 1 + dx : width - 1 + dx]
+        for dy, dx in NEIGHBOURS
+    ]
+
+
+def label_numbers(grid: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Label each run of digits, counting from one.
+
+    Returns the grid of labels (zero off any number) and the value of each number,
+    indexed by label minus one. Raises OverflowError if a number is too long to fit
+    in an int64.
+    """
+    is_digit = (grid >= ord("0")) & (grid <= ord("9"))
+    flat_digits = is_digit.ravel()
+    # The border keeps runs from wrapping from the end of one row to the next
+    starts = flat_digits & ~np.concatenate([[False], flat_digits[:-1]])
+    ends = flat_digits & ~np.concatenate([flat_digits[1:], [False]])
+    labels = np.cumsum(starts) * flat_digits
+
+    digit_cells = np.flatnonzero(flat_digits)
+    run_ids = labels[digit_cells] - 1
+    places = np.flatnonzero(ends)[run_ids] - digit_cells
+    if places.size and places.max() >= MAX_DIGITS:
+        raise OverflowError(f"Numbers over {MAX_DIGITS} digits don't fit in an int64")
+    digits = grid.ravel()[digit_cells].astype(np.int64) - ord("0")
+    values = np.zeros(int(starts.sum()), dtype=np.int64)
+    np.add.at(values, run_ids, digits * 10**places)
+    return labels.reshape(grid.shape), values
+
+
+def part_number_sum(grid: np.ndarray, labels: np.ndarray, values: np.ndarray) -> int:
+    """Sum the numbers with a symbol in any of the cells around them."""
+    is_symbol = (grid != ord(".")) & ((grid < ord("0")) | (grid > ord("9")))
+    near_symbol = np.zeros_like(is_symbol)
+    near_symbol[1:-1, 1:-1] = np.logical_or.reduce(neighbourhood(is_symbol))
+    touching = np.unique(labels[near_symbol & (labels > 0)])
+    # Summed as Python ints, since even numbers that fit can overflow when added
+    return sum(values[touching - 1].tolist())
+
+
+def gear_ratio_sum(grid: np.ndarray, labels: np.ndarray, values: np.ndarray) -> int:
+    """Sum the products of the two numbers around every gear with exactly two."""
+    gears = grid[1:-1, 1:-1] == ord("*")
+    around = np.sort(
+        np.stack([shifted[gears] for shifted in neighbourhood(labels)], axis=1),
+        axis=1,
+    )
+    # Each number touching a gear shows up once for every cell of it that touches
+    distinct = (around[:, 1:] != around[:, :-1]) & (around[:, 1:] > 0)
+    counts = distinct.sum(axis=1) + (around[:, 0] > 0)
+
+    pairs = around[counts == 2]
+    largest = pairs[:, -1]
+    smallest = np.where(pairs > 0, pairs, largest[:, None]).min(axis=1)
+    return sum(
+        a * b
+        for a, b in zip(values[smallest - 1].tolist(), values[largest - 1].tolist())
+    )
+
+
+def run(file: BinaryIO) -> Iterator[Any]:
+    """Solution for Day 03."""
+    data = read_schematic(file)
+    grid = read_grid(data)
+    labelled = None
+    if grid is not None:
+        try:
+            labelled = label_numbers(grid)
+        except OverflowError:
+            pass
+    if grid is None or labelled is None:
+        # The streaming solution handles ragged rows and numbers of any length
+        yield from run_streaming(BytesIO(data))
+        return
+    labels, values = labelled
+    yield part_number_sum(grid, labels, values)
+    yield gear_ratio_sum(grid, labels, values)
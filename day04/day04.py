@@ -1,27 +1,99 @@
 """Day 04."""
 
-from collections import defaultdict
-from typing import Any, Iterator, TextIO
+from functools import reduce
+from operator import or_
+from typing import Any, BinaryIO, Iterable, Iterator
 
-from utils.parse import read_lines
+from utils.parse import read_chunked_lines
 
+INPUT_MODE = "bytes"
 
-def run(file: TextIO) -> Iterator[Any]:
+# Numbers past this would make masks (and the cache of bits) too big to be worth it
+BIT_LIMIT = 1024
+
+
+class NumberBits(dict[bytes, int]):
+    """The bit standing for each number, computed the first time it's seen."""
+
+    def __missing__(self, token: bytes) -> int:
+        """Compute the bit for a number that hasn't been seen before."""
+        number = int(token)
+        if not 0 <= number < BIT_LIMIT:
+            raise OverflowError(f"{number} has no bit in a mask")
+        bit = self[token] = 1 << number
+        return bit
+
+
+number_bits = NumberBits()
+
+
+def number_mask(numbers: Iterable[bytes]) -> int:
+    """Pack numbers into an int with one bit set for each."""
+    return reduce(or_, map(number_bits.__getitem__, numbers), 0)
+
+
+def match_count(line: bytes) -> int:
+    """Count the held numbers on a card that are also winning numbers."""
+    _, label_separator, numbers = line.partition(b": ")
+    winning_numbers, list_separator, my_numbers = numbers.partition(b" | ")
+    if not label_separator or not list_separator:
+        raise ValueError(f"Malformed card: {line!r}")
+    winning, mine = winning_numbers.split(), my_numbers.split()
+    try:
+        return (number_mask(winning) & number_mask(mine)).bit_count()
+    except OverflowError:
+        return len(set(map(int, winning)) & set(map(int, mine)))
+
+
+class CardCounter:
+    """Counts the instances of each card as copies are won, in constant memory.
+
+    Winning copies adds to a running count for the next few cards. Rather than
+    adding to each of those cards, the amount is added to the running count once
+    and queued to come off it again at the first card past the range. The queue is
+    a ring buffer one longer than the most matches seen so far.
+    """
+
+    def __init__(self) -> None:
+        """Initialize before the first card."""
+        self.expiring = [0]
+        self.running = 0
+        self.card_num = 0
+
+    def grow(self, size: int) -> None:
+        """Lengthen the ring buffer, keeping the amounts queued for later cards."""
+        old_size = len(self.expiring)
+        expiring = [0] * size
+        for card_num in range(self.card_num + 1, self.card_num + old_size):
+            expiring[card_num % size] = self.expiring[card_num % old_size]
+        self.expiring = expiring
+
+    def add_card(self, matches: int) -> int:
+        """Move on to the next card, returning how many instances of it there are."""
+        self.card_num += 1
+        slot = self.card_num % len(self.expiring)
+        self.running -= self.expiring[slot]
+        self.expiring[slot] = 0
+        instances = self.running + 1
+
+        if matches >= len(self.expiring):
+            self.grow(matches + 1)
+        if matches > 0:
+            self.running += instances
+            end = self.card_num + matches + 1
+            self.expiring[end % len(self.expiring)] += instances
+        return instances
+
+
+def run(file: BinaryIO) -> Iterator[Any]:
     """Solution for Day 04."""
     part1 = 0
-    copies = defaultdict[int, int](int)
-    card_num = 0
-    for card_num, line in enumerate(read_lines(file), start=1):
-        _, numbers = line.split(": ")
-        winning_number_list, my_number_list = numbers.split(" | ")
-        winning_numbers = set(
-            int(num) for num in winning_number_list.split(" ") if num.strip()
-        )
-        my_numbers = set(int(num) for num in my_number_list.split(" ") if num.strip())
-        match_count = len(my_numbers.intersection(winning_numbers))
-        for i in range(card_num + 1, card_num + match_count + 1):
-            copies[i] += copies[card_num] + 1
-        if match_count > 0:
-            part1 += 2 ** (match_count - 1)
+    part2 = 0
+    counter = CardCounter()
+    for line in read_chunked_lines(file):
+        matches = match_count(line)
+        part2 += counter.add_card(matches)
+        if matches > 0:
+            part1 += 2 ** (matches - 1)
     yield part1
-    yield sum(copies.values()) + card_num
+    yield part2
@@ -0,0 +1,42 @@
+"""Synthetic input generator for Day 04."""
+
+from random import Random
+
+WINNING_COUNT = 10
+HELD_COUNT = 25
+NO_MATCH_CHANCE = 0.7
+
+
+def random_match_count(rng: Random) -> int:
+    """Pick how many numbers a card matches, most often none.
+
+    Each copy of a card wins less than one copy of a later card on average, so the
+    number of copies grows linearly with the number of cards, not exponentially.
+    """
+    if rng.random() < NO_MATCH_CHANCE:
+        return 0
+    # Halving the chance of each extra match gives a mean of about 2
+    matches = 1
+    while matches < WINNING_COUNT and rng.random() < 0.5:
+        matches += 1
+    return matches
+
+
+def generate(scale: int, rng: Random) -> str:
+    """Generate scale scratchcards."""
+    width = len(str(scale))
+    lines = []
+    for card_num in range(1, scale + 1):
+        # Cards never win copies of cards past the end of the table
+        matches = min(random_match_count(rng), scale - card_num)
+        winning = rng.sample(range(1, 100), WINNING_COUNT)
+        others = [n for n in range(1, 100) if n not in winning]
+        held = rng.sample(winning, matches) + rng.sample(others, HELD_COUNT - matches)
+        rng.shuffle(held)
+        lines.append(
+            f"Card {card_num:>{width}}: "
+            + " ".join(f"{n:>2}" for n in winning)
+            + " | "
+            + " ".join(f"{n:>2}" for n in held)
+        )
+    return "\n".join(lines) + "\n"
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from typing import Any, Iterator, TextIO
 
 from utils.iterables import grouper
@@ -20,20 +21,6 @@ class Range:
     def empty(self) -> bool:
         return self.upper <= self.lower
 
-    def get_overlap(self, other: Range) -> Range | None:
-        """Get the overlapping portion of two ranges."""
-        lower = max(self.lower, other.lower)
-        upper = min(self.upper, other.upper)
-        if lower < upper:
-            return Range(lower, upper)
-        return None
-
-    def remove_range(self, other: Range) -> list[Range]:
-        """Get the leftover portion of a range when a part is removed."""
-        lower = Range(self.lower, other.lower)
-        upper = Range(other.upper, self.upper)
-        return [r for r in [lower, upper] if not r.empty]
-
 
 @dataclass
 class MappingRange(Range):
@@ -44,41 +31,73 @@ class MappingRange(Range):
 
 @dataclass
 class Mapping:
-    """A class that maps one category to another."""
+    """A class that maps one category to another.
+
+    The special ranges are indexed as sorted segments, with the gaps between them
+    filled by segments that map values to themselves. Segment i starts at
+    starts[i], runs up to the start of the next, and adds offsets[i]. Values before
+    the first segment are also mapped to themselves.
+    """
 
     source_category: str
     dest_category: str
     special_ranges: list[MappingRange]
+    starts: list[int] = field(init=False, default_factory=list)
+    offsets: list[int] = field(init=False, default_factory=list)
+
+    def __post_init__(self) -> None:
+        """Build the segment index from the special ranges."""
+        self.special_ranges.sort(key=lambda r: r.lower)
+        end = None
+        for special_range in self.special_ranges:
+            if end is not None and end < special_range.lower:
+                self.starts.append(end)
+                self.offsets.append(0)
+            self.starts.append(special_range.lower)
+            self.offsets.append(special_range.offset)
+            end = special_range.upper
+        if end is not None:
+            self.starts.append(end)
+            self.offsets.append(0)
 
     def map(self, value: int) -> int:
         """Map a value from the input category to the destination category."""
-        for special_range in self.special_ranges:
-            if special_range.lower <= value <= special_range.upper:
-                return value + special_range.offset
-        return value
+        i = bisect_right(self.starts, value) - 1
+        return value + self.offsets[i] if i >= 0 else value
 
     def map_range(self, starting_range: Range) -> list[Range]:
-        """Map a range from the input category to the destination category."""
+        """Map a range from the input category to the destination category.
+
+        Sweeps along the segments from the one holding the start of the range,
+        splitting the range wherever it crosses into the next segment.
+        """
         result = []
-        input_ranges = [starting_range]
-        while input_ranges:
-            input_range = input_ranges.pop()
-            for special_range in self.special_ranges:
-                overlap = input_range.get_overlap(special_range)
-                if overlap:
-                    result.append(
-                        Range(
-                            overlap.lower + special_range.offset,
-                            overlap.upper + special_range.offset,
-                        )
-                    )
-                    input_ranges.extend(input_range.remove_range(overlap))
-                    break
-            else:
-                result.append(input_range)
+        lower = starting_range.lower
+        i = bisect_right(self.starts, lower) - 1
+        while lower < starting_range.upper:
+            offset = self.offsets[i] if i >= 0 else 0
+            upper = starting_range.upper
+            if i + 1 < len(self.starts):
+                upper = min(upper, self.starts[i + 1])
+            result.append(Range(lower + offset, upper + offset))
+            lower = upper
+            i += 1
         return result
 
 
+def merge_ranges(ranges: list[Range]) -> list[Range]:
+    """Merge overlapping and touching ranges, dropping empty ones."""
+    merged: list[Range] = []
+    for r in sorted(ranges, key=lambda r: r.lower):
+        if r.empty:
+            continue
+        if merged and r.lower <= merged[-1].upper:
+            merged[-1].upper = max(merged[-1].upper, r.upper)
+        else:
+            merged.append(Range(r.lower, r.upper))
+    return merged
+
+
 def parse_mappings(lines: Iterator[str]) -> dict[str, Mapping]:
     """Parse the mappings."""
     result = {}
@@ -129,7 +148,8 @@ def map_seed_range(
             for new_range in mapping.map_range(current_range):
                 new_ranges.append(new_range)
 
-        current_ranges = new_ranges
+        # Fragments that land next to each other are mapped together from now on
+        current_ranges = merge_ranges(new_ranges)
         category = mapping.dest_category
     return current_ranges
 
@@ -0,0 +1,33 @@
+"""Synthetic input generator for Day 05."""
+
+from random import Random
+
+CATEGORIES = [
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+]
+UPPER = 1 << 32
+SEED_PAIRS = 10
+
+
+def generate(scale: int, rng: Random) -> str:
+    """Generate an almanac with scale mapping lines per map."""
+    seeds = []
+    for _ in range(SEED_PAIRS):
+        seeds += [rng.randrange(UPPER // 2), rng.randrange(1, UPPER // 16)]
+    sections = ["seeds: " + " ".join(map(str, seeds))]
+
+    for source, dest in zip(CATEGORIES, CATEGORIES[1:]):
+        # Pairs of sorted points make ranges that don't overlap, with gaps between
+        points = sorted(rng.sample(range(UPPER), 2 * scale))
+        lines = [f"{source}-to-{dest} map:"]
+        for lower, upper in zip(points[::2], points[1::2]):
+            lines.append(f"{rng.randrange(UPPER)} {lower} {upper - lower}")
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections) + "\n"
@@ -21,8 +21,7 @@ def extrapolate(line: list[int]) -> tuple[int, int]:
 
 def run(file: TextIO) -> Iterator[Any]:
     """Solution for Day 09."""
-    lines = list(read_lines(file))
-    data = [[int(x) for x in line.split(" ")] for line in lines]
+    data = [[int(x) for x in line.split(" ")] for line in read_lines(file)]
     results = [extrapolate(x) for x in data]
     yield sum(val for _, val in results)
     yield sum(val for val, _ in results)
@@ -0,0 +1,18 @@
+"""Synthetic input generator for Day 09."""
+
+from random import Random
+
+LENGTH = 21
+
+
+def generate(scale: int, rng: Random) -> str:
+    """Generate scale polynomial sequences."""
+    lines = []
+    for _ in range(scale):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 6))]
+        values = [
+            sum(c * x**power for power, c in enumerate(coefficients))
+            for x in range(LENGTH)
+        ]
+        lines.append(" ".join(str(v) for v in values))
+    return "\n".join(lines) + "\n"
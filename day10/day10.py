@@ -2,93 +2,75 @@
 
 from typing import Any, Iterator, TextIO
 
-from utils.parse import read_lines
-
-Point = tuple[int, int]
-
-UP = (0, -1)
-DOWN = (0, 1)
-LEFT = (-1, 0)
-RIGHT = (1, 0)
-
-OPPOSITES = {
-    UP: DOWN,
-    DOWN: UP,
-    LEFT: RIGHT,
-    RIGHT: LEFT,
-}
+from utils.grid import Grid
 
 PIPE_NEIGHBOURS = {
-    "|": {UP, DOWN},
-    "-": {LEFT, RIGHT},
-    "L": {UP, RIGHT},
-    "J": {UP, LEFT},
-    "7": {LEFT, DOWN},
-    "F": {RIGHT, DOWN},
+    "|": ("up", "down"),
+    "-": ("left", "right"),
+    "L": ("up", "right"),
+    "J": ("up", "left"),
+    "7": ("left", "down"),
+    "F": ("right", "down"),
 }
 
 
+def pipe_offsets(grid: Grid) -> dict[int, frozenset[int]]:
+    """Get the offsets to the cells each pipe connects, keyed on the pipe's value."""
+    return {
+        ord(pipe): frozenset(getattr(grid, direction) for direction in directions)
+        for pipe, directions in PIPE_NEIGHBOURS.items()
+    }
+
+
 def get_loop_spaces(
-    position: Point, direction: Point, pipes: dict[Point, str], start: Point
-) -> tuple[set[Point], set[Point]] | None:
+    grid: Grid, offsets: dict[int, frozenset[int]], start: int, direction: int
+) -> tuple[set[int], set[int]] | None:
     """Find spaces making up a loop, or None if it's not a loop.
 
     Also return the directions leading out of the start node.
     """
     spaces = {start}
     start_directions = {direction}
+    position = start
     while True:
-        position = (position[0] + direction[0], position[1] + direction[1])
+        position += direction
         if position == start:
-            start_directions.add(OPPOSITES[direction])
+            start_directions.add(-direction)
             break
-        new_pipe = pipes.get(position)
-        if new_pipe is None:
+        # The border isn't a pipe, so walking off the grid ends here too
+        pipe_neighbours = offsets.get(grid[position])
+        if pipe_neighbours is None or -direction not in pipe_neighbours:
             return None
-        opposite = OPPOSITES[direction]
-        pipe_neighbours = PIPE_NEIGHBOURS[new_pipe]
-        if opposite not in pipe_neighbours:
-            return None
-        direction = next(p for p in pipe_neighbours if p != opposite)
+        direction = next(d for d in pipe_neighbours if d != -direction)
         spaces.add(position)
     return spaces, start_directions
 
 
 def run(file: TextIO) -> Iterator[Any]:
     """Solution for Day 10."""
-    pipes = {}
-    for y, line in enumerate(read_lines(file)):
-        for x, char in enumerate(line):
-            if char == "S":
-                start = (x, y)
-            if char in PIPE_NEIGHBOURS:
-                pipes[(x, y)] = char
+    grid = Grid.from_file(file)
+    offsets = pipe_offsets(grid)
+    start = grid.find("S")
 
-    for direction in [UP, DOWN, LEFT, RIGHT]:
-        result = get_loop_spaces(start, direction, pipes, start)
+    for direction in grid.directions:
+        result = get_loop_spaces(grid, offsets, start, direction)
         if result is not None:
             loop, start_directions = result
-            start_pipe = next(
-                k for k, v in PIPE_NEIGHBOURS.items() if v == start_directions
-            )
+            start_pipe = next(k for k, v in offsets.items() if v == start_directions)
             break
     else:
         raise Exception("No loop found")
 
     yield len(loop) // 2
 
-    pipes[start] = start_pipe
-    min_x = min(x for x, _ in loop)
-    max_x = max(x for x, _ in loop)
-    min_y = min(y for _, y in loop)
-    max_y = max(y for _, y in loop)
-
+    grid[start] = start_pipe
     enclosed = 0
-    for y in range(min_y, max_y + 1):
+    for y in range(grid.height):
         in_loop = False
-        for x in range(min_x, max_x + 1):
-            if (x, y) in loop:
-                if UP in PIPE_NEIGHBOURS[pipes[(x, y)]]:
+        row_start = grid.index(0, y)
+        for index in range(row_start, row_start + grid.width):
+            if index in loop:
+                if grid.up in offsets[grid[index]]:
                     in_loop = not in_loop
             elif in_loop:
                 enclosed += 1
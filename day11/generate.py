@@ -0,0 +1,26 @@
+"""Synthetic input generator for Day 11."""
+
+from math import isqrt
+from random import Random
+
+
+def generate(scale: int, rng: Random) -> str:
+    """Generate a square image of about scale cells."""
+    side = isqrt(scale)
+    empty_rows = set(rng.sample(range(side), side // 20))
+    empty_cols = set(rng.sample(range(side), side // 20))
+    rows = []
+    for y in range(side):
+        rows.append(
+            "".join(
+                (
+                    "#"
+                    if y not in empty_rows
+                    and x not in empty_cols
+                    and rng.random() < 0.02
+                    else "."
+                )
+                for x in range(side)
+            )
+        )
+    return "\n".join(rows) + "\n"
@@ -0,0 +1,22 @@
+"""Synthetic input generator for Day 12."""
+
+from random import Random
+
+# Counting arrangements is slow enough per row that a few hundred rows is plenty
+DEFAULT_SCALE = 200
+
+
+def generate(scale: int, rng: Random) -> str:
+    """Generate scale rows of springs."""
+    lines = []
+    for _ in range(scale):
+        counts = [rng.randint(1, 6) for _ in range(rng.randint(1, 6))]
+        springs = []
+        for count in counts:
+            springs.extend("." * rng.randint(int(bool(springs)), 3))
+            springs.extend("#" * count)
+        springs.extend("." * rng.randint(0, 3))
+        # Hide some of the springs so there are arrangements to count
+        hidden = ["?" if rng.random() < 0.4 else c for c in springs]
+        lines.append("".join(hidden) + " " + ",".join(str(c) for c in counts))
+    return "\n".join(lines) + "\n"
@@ -1,81 +1,96 @@
 """Day 16."""
 
-from collections import defaultdict
 from typing import Any, Iterator, TextIO
 
-from utils.parse import read_lines
+from utils.grid import Grid
 
-Point = tuple[int, int]
+SPLIT_HORIZONTAL = ord("-")
+SPLIT_VERTICAL = ord("|")
+MIRROR_FORWARD = ord("/")
+MIRROR_BACKWARD = ord("\\")
 
 
-class Grid:
-    def __init__(self, data: list[list[str]]) -> None:
-        """Initialize a grid with an empty memo."""
-        self.data = data
-        self.width = len(data[0])
-        self.height = len(data)
-        self.size = (self.width, self.height)
-        self.beam_memo = defaultdict[Point, set[Point]](set)
-
-    def in_bounds(self, position: Point) -> bool:
-        """Check if a position is in bounds."""
-        return 0 <= position[0] < self.width and 0 <= position[1] < self.width
+class Contraption:
+    def __init__(self, grid: Grid) -> None:
+        """Initialize a contraption with an empty memo."""
+        self.grid = grid
+        # Each cell stores a bitmask of the directions a beam has passed through it
+        self.beam_memo = bytearray(len(grid.data))
+        self.direction_bits = {
+            direction: 1 << bit for bit, direction in enumerate(grid.directions)
+        }
+        self.horizontal = (grid.left, grid.right)
+        self.forward_mirror = {
+            grid.right: grid.up,
+            grid.up: grid.right,
+            grid.left: grid.down,
+            grid.down: grid.left,
+        }
+        self.backward_mirror = {
+            grid.right: grid.down,
+            grid.down: grid.right,
+            grid.left: grid.up,
+            grid.up: grid.left,
+        }
 
     @property
     def visited(self) -> int:
         """Get the number of positions visited by the beam."""
-        return len(self.beam_memo)
+        return len(self.beam_memo) - self.beam_memo.count(0)
 
     def reset(self) -> None:
         """Reset the visited positions."""
-        self.beam_memo.clear()
+        self.beam_memo[:] = bytes(len(self.beam_memo))
 
-    def follow_beam(self, start_position: Point, velocity: Point) -> None:
+    def follow_beam(self, start_position: int, velocity: int) -> None:
         """Follow a beam until it terminates or overlaps with a previous beam."""
+        data = self.grid.data
+        border = self.grid.border
+        beam_memo = self.beam_memo
+        bit = self.direction_bits[velocity]
         position = start_position
         while True:
-            position = (
-                position[0] + velocity[0],
-                position[1] + velocity[1],
-            )
-            if not self.in_bounds(position):
+            position += velocity
+            cell = data[position]
+            if cell == border:
+                break
+            if beam_memo[position] & bit:
+                break
+            beam_memo[position] |= bit
+            if cell == MIRROR_FORWARD:
+                velocity = self.forward_mirror[velocity]
+                bit = self.direction_bits[velocity]
+            elif cell == MIRROR_BACKWARD:
+                velocity = self.backward_mirror[velocity]
+                bit = self.direction_bits[velocity]
+            elif cell == SPLIT_HORIZONTAL and velocity not in self.horizontal:
+                self.follow_beam(position, self.grid.left)
+                self.follow_beam(position, self.grid.right)
                 break
-            if velocity in self.beam_memo[position]:
+            elif cell == SPLIT_VERTICAL and velocity in self.horizontal:
+                self.follow_beam(position, self.grid.up)
+                self.follow_beam(position, self.grid.down)
                 break
-            self.beam_memo[position].add(velocity)
-            match (self.data[position[1]][position[0]], velocity):
-                case "/", _:
-                    velocity = (-velocity[1], -velocity[0])
-                case "\\", _:
-                    velocity = (velocity[1], velocity[0])
-                case "-", (0, _):
-                    self.follow_beam(position, (-1, 0))
-                    self.follow_beam(position, (1, 0))
-                    break
-                case "|", (_, 0):
-                    self.follow_beam(position, (0, -1))
-                    self.follow_beam(position, (0, 1))
-                    break
 
 
 def run(file: TextIO) -> Iterator[Any]:
     """Solution for Day 16."""
-    grid = Grid(list(read_lines(file)))
-    grid.follow_beam((-1, 0), (1, 0))
-    yield grid.visited
+    grid = Grid.from_file(file)
+    contraption = Contraption(grid)
+    contraption.follow_beam(grid.index(-1, 0), grid.right)
+    yield contraption.visited
 
-    max_energized = 0
-    for coord in [0, 1]:
-        for direction in [-1, 1]:
-            for entry in range(0, grid.size[coord]):
-                start_position = [0, 0]
-                start_position[coord] = -1 if direction == 1 else grid.size[1 - coord]
-                start_position[1 - coord] = entry
-
-                velocity = [0, 0]
-                velocity[coord] = direction
+    entry_points = []
+    for y in range(grid.height):
+        entry_points.append((grid.index(-1, y), grid.right))
+        entry_points.append((grid.index(grid.width, y), grid.left))
+    for x in range(grid.width):
+        entry_points.append((grid.index(x, -1), grid.down))
+        entry_points.append((grid.index(x, grid.height), grid.up))
 
-                grid.reset()
-                grid.follow_beam(tuple(start_position), tuple(velocity))
-                max_energized = max(max_energized, grid.visited)
+    max_energized = 0
+    for start_position, velocity in entry_points:
+        contraption.reset()
+        contraption.follow_beam(start_position, velocity)
+        max_energized = max(max_energized, contraption.visited)
     yield max_energized
@@ -0,0 +1,13 @@
+"""Synthetic input generator for Day 16."""
+
+from math import isqrt
+from random import Random
+
+TILES = "." * 20 + "/\\|-"
+
+
+def generate(scale: int, rng: Random) -> str:
+    """Generate a square contraption of about scale cells."""
+    side = isqrt(scale)
+    rows = ["".join(rng.choice(TILES) for _ in range(side)) for _ in range(side)]
+    return "\n".join(rows) + "\n"
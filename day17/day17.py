@@ -1,79 +1,56 @@
 """Day 17."""
 
 import heapq
-from collections import defaultdict
+from math import inf
 from typing import Any, Iterator, TextIO
 
-from utils.parse import read_lines
+from utils.grid import Grid
 
-Point = tuple[int, int]
-
-TURN_RIGHT = {
-    (0, 1): (-1, 0),
-    (-1, 0): (0, -1),
-    (0, -1): (1, 0),
-    (1, 0): (0, 1),
-}
-TURN_LEFT = {
-    (0, 1): (1, 0),
-    (-1, 0): (0, 1),
-    (0, -1): (-1, 0),
-    (1, 0): (0, -1),
-}
+ZERO = ord("0")
 
 
 class Dijkstra:
-    def __init__(self, grid: list[list[int]], min_spaces: int, max_spaces: int) -> None:
+    def __init__(self, grid: Grid, min_spaces: int, max_spaces: int) -> None:
         self.grid = grid
-        self.width = len(grid[0])
-        self.height = len(grid)
         self.min_spaces = min_spaces
         self.max_spaces = max_spaces
+        # Directions are stored as an index into the grid's clockwise directions
+        self.offsets = grid.directions
 
-    def in_bounds(self, point: Point) -> bool:
-        """Check if a point is in the bounds."""
-        return 0 <= point[0] < self.width and 0 <= point[1] < self.height
+    def state(self, position: int, direction: int, distance: int) -> int:
+        """Pack a position, direction and distance travelled into a single int."""
+        return (position * 4 + direction) * self.max_spaces + distance
 
     def neighbours(
-        self, position: Point, velocity: Point, distance: int
-    ) -> list[tuple[Point, Point, int]]:
+        self, position: int, direction: int, distance: int
+    ) -> list[tuple[int, int, int]]:
         """Find the neighbours of a given point, direction and distance travelled."""
         result = []
-        left_velocity = TURN_LEFT[velocity]
         if distance >= self.min_spaces - 1:
-            left_new_position = (
-                position[0] + left_velocity[0],
-                position[1] + left_velocity[1],
-            )
-            result.append((left_new_position, left_velocity, 0))
-            right_velocity = TURN_RIGHT[velocity]
-            right_new_position = (
-                position[0] + right_velocity[0],
-                position[1] + right_velocity[1],
+            left_direction = (direction + 3) % 4
+            result.append((position + self.offsets[left_direction], left_direction, 0))
+            right_direction = (direction + 1) % 4
+            result.append(
+                (position + self.offsets[right_direction], right_direction, 0)
             )
-            result.append((right_new_position, right_velocity, 0))
         if distance < self.max_spaces - 1:
-            straight_new_position = (
-                position[0] + velocity[0],
-                position[1] + velocity[1],
-            )
-            result.append((straight_new_position, velocity, distance + 1))
-        return [(p, v, d) for p, v, d in result if self.in_bounds(p)]
+            result.append((position + self.offsets[direction], direction, distance + 1))
+        return [(p, d, s) for p, d, s in result if self.grid.in_bounds(p)]
 
-    def get_heat(self, point: Point) -> int:
+    def get_heat(self, position: int) -> int:
         """Get the heat at a point."""
-        return self.grid[point[1]][point[0]]
+        return self.grid[position] - ZERO
 
-    def dijkstra(self, starting_positions: list[tuple[Point, Point]]) -> int:
+    def dijkstra(self, starting_positions: list[tuple[int, int]]) -> int:
         """Find the minimum heat that can be carried to the end."""
-        destination = (self.width - 1, self.height - 1)
+        destination = self.grid.index(self.grid.width - 1, self.grid.height - 1)
 
         queue = [(self.get_heat(pos), pos, dir, 0) for pos, dir in starting_positions]
         heapq.heapify(queue)
 
-        total_heats = defaultdict[Point, dict[tuple[Point, int], int]](dict)
+        total_heats = [inf] * self.state(len(self.grid.data), 0, 0)
         for pos, dir in starting_positions:
-            total_heats[pos][(dir, 0)] = self.get_heat(pos)
+            total_heats[self.state(pos, dir, 0)] = self.get_heat(pos)
 
         while queue:
             heat, position, direction, distance = heapq.heappop(queue)
@@ -82,33 +59,29 @@ class Dijkstra:
                 position, direction, distance
             ):
                 new_heat = heat + self.get_heat(new_position)
-                neighbour_total_heats = total_heats[new_position]
-                if (
-                    new_direction,
-                    new_distance,
-                ) not in neighbour_total_heats or neighbour_total_heats[
-                    (new_direction, new_distance)
-                ] > new_heat:
-                    neighbour_total_heats[(new_direction, new_distance)] = new_heat
+                state = self.state(new_position, new_direction, new_distance)
+                if total_heats[state] > new_heat:
+                    total_heats[state] = new_heat
                     heapq.heappush(
                         queue, (new_heat, new_position, new_direction, new_distance)
                     )
 
         return min(
-            heat
-            for (_, distance), heat in total_heats[destination].items()
-            if distance >= self.min_spaces - 1
+            total_heats[self.state(destination, direction, distance)]
+            for direction in range(4)
+            for distance in range(max(self.min_spaces - 1, 0), self.max_spaces)
         )
 
 
 def run(file: TextIO) -> Iterator[Any]:
     """Solution for Day 17."""
-    heats = [[int(x) for x in line] for line in read_lines(file)]
-    p1_grid = Dijkstra(heats, 0, 3)
-    p2_grid = Dijkstra(heats, 4, 10)
+    grid = Grid.from_file(file)
+    p1_grid = Dijkstra(grid, 0, 3)
+    p2_grid = Dijkstra(grid, 4, 10)
+    # Start moving right or down from the top left
     start_points = [
-        ((0, 1), (0, 1)),
-        ((1, 0), (1, 0)),
+        (grid.index(0, 1), grid.directions.index(grid.down)),
+        (grid.index(1, 0), grid.directions.index(grid.right)),
     ]
     yield p1_grid.dijkstra(start_points)
     yield p2_grid.dijkstra(start_points)
@@ -0,0 +1,11 @@
+"""Synthetic input generator for Day 17."""
+
+from math import isqrt
+from random import Random
+
+
+def generate(scale: int, rng: Random) -> str:
+    """Generate a square map of heat loss of about scale cells."""
+    side = isqrt(scale)
+    rows = ["".join(rng.choice("123456789") for _ in range(side)) for _ in range(side)]
+    return "\n".join(rows) + "\n"
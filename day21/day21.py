@@ -2,53 +2,41 @@
 
 from typing import Any, Iterator, TextIO
 
-from utils.parse import read_lines
+from utils.grid import Grid
 
-Point = tuple[int, int]
+PLOT = ord(".")
 
-DIRECTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0)]
 
+class Garden:
+    """A class representing the garden."""
 
-class Grid:
-    """A class representing the grid."""
+    def __init__(self, grid: Grid) -> None:
+        """Initialize from a grid."""
+        self.grid = grid
 
-    def __init__(self, data: list[list[str]], wrap: bool) -> None:
-        """Initialize from data."""
-        self.height = len(data)
-        self.width = len(data[0])
-        self.data = data
-        self.wrap = wrap
-
-    def in_bounds(self, point: Point) -> bool:
-        """Determine if a point is in bounds."""
-        if self.wrap:
-            return True
-        return 0 <= point[0] < self.width and 0 <= point[1] < self.height
-
-    def neighbours(self, point: Point) -> list[Point]:
+    def neighbours(self, point: int) -> list[int]:
         """Find neighbours of a point."""
-        result = [(point[0] + dir[0], point[1] + dir[1]) for dir in DIRECTIONS]
-        return [p for p in result if self.in_bounds(p) and self.get_data(p) == "."]
+        data = self.grid.data
+        return [point + d for d in self.grid.directions if data[point + d] == PLOT]
 
-    def get_data(self, point: Point) -> str:
-        x, y = point
-        if self.wrap:
-            x %= self.width
-            y %= self.height
-        return self.data[y][x]
-
-    def bfs(self, start_positions: set[Point], steps: int) -> set[Point]:
+    def bfs(self, start_positions: set[int], steps: int) -> set[int]:
         """Breadth first search for a certain number of steps."""
         positions = start_positions
         for _ in range(steps):
             new_positions = set()
             for position in positions:
-                for n in self.neighbours(position):
-                    new_positions.add(n)
+                new_positions.update(self.neighbours(position))
             positions = new_positions
         return positions
 
 
+def tile_grid(grid: Grid, radius: int) -> Grid:
+    """Repeat a grid in every direction, radius times."""
+    count = radius * 2 + 1
+    rows = [grid.row(y).decode("ascii") * count for y in range(grid.height)]
+    return Grid(rows * count)
+
+
 def newton_polynomial(y1: int, y2: int, y3: int, n: int) -> int:
     """What a terrible problem.
 
@@ -63,25 +51,32 @@ def newton_polynomial(y1: int, y2: int, y3: int, n: int) -> int:
 
 def run(file: TextIO) -> Iterator[Any]:
     """Solution for Day 21."""
-    data = []
-    for y, line in enumerate(read_lines(file)):
-        row = []
-        for x, char in enumerate(line):
-            if char == "S":
-                start_position = (x, y)
-                row.append(".")
-            else:
-                row.append(char)
-        data.append(row)
-
-    grid = Grid(data, False)
-    positions = grid.bfs({start_position}, 64)
+    grid = Grid.from_file(file)
+    start_position = grid.find("S")
+    grid[start_position] = PLOT
 
-    yield len(positions)
+    positions = Garden(grid).bfs({start_position}, 64)
 
-    grid_p2 = Grid(data, True)
-    p1 = grid_p2.bfs(positions, 1)
-    p2 = grid_p2.bfs(p1, 131)
-    p3 = grid_p2.bfs(p2, 131)
+    yield len(positions)
 
-    yield newton_polynomial(len(p1), len(p2), len(p3), (26501365 - 65) // 131)
+    # Rather than wrapping around the edges, tile the grid enough times that the
+    # search never reaches the edge of the tiled grid.
+    total_steps = 26501365
+    sample_steps = [1, 131, 131]
+    radius = sum(sample_steps) // min(grid.width, grid.height) + 1
+    tiled_grid = tile_grid(grid, radius)
+    garden_p2 = Garden(tiled_grid)
+
+    tiled_positions = set()
+    for position in positions:
+        x, y = grid.position(position)
+        tiled_positions.add(
+            tiled_grid.index(x + radius * grid.width, y + radius * grid.height)
+        )
+
+    samples = []
+    for steps in sample_steps:
+        tiled_positions = garden_p2.bfs(tiled_positions, steps)
+        samples.append(len(tiled_positions))
+
+    yield newton_polynomial(*samples, (total_steps - 65) // 131)
@@ -0,0 +1,21 @@
+"""Synthetic input generator for Day 22."""
+
+from random import Random
+
+
+def generate(scale: int, rng: Random) -> str:
+    """Generate a snapshot of scale falling bricks."""
+    lines = []
+    for i in range(scale):
+        # Space the bricks out so none of them overlap before falling
+        z = 1 + i * 4
+        start = [rng.randint(0, 9), rng.randint(0, 9), z]
+        stop = list(start)
+        axis = rng.randint(0, 2)
+        stop[axis] += rng.randint(0, 3)
+        stop[0] = min(stop[0], 9)
+        stop[1] = min(stop[1], 9)
+        lines.append(
+            ",".join(str(c) for c in start) + "~" + ",".join(str(c) for c in stop)
+        )
+    return "\n".join(lines) + "\n"
@@ -3,53 +3,42 @@
 from collections import defaultdict, deque
 from typing import Any, Iterator, TextIO
 
-from utils.parse import read_lines
+from utils.grid import Grid
 
-Point = tuple[int, int]
+PATH = ord(".")
 
-DIRECTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-SLOPES = {">": (1, 0), "<": (-1, 0), "^": (0, -1), "v": (0, 1)}
 
-
-class Grid:
-    def __init__(self, data: list[list[str]], slippery: bool) -> None:
-        """Initialize from data."""
-        self.data = data
-        self.height = len(data)
-        self.width = len(data[0])
+class Maze:
+    def __init__(self, grid: Grid, slippery: bool) -> None:
+        """Initialize from a grid."""
+        self.grid = grid
         self.slippery = slippery
-
-    def in_bounds(self, point: Point) -> bool:
-        """Determine if a point is in bounds."""
-        return 0 <= point[0] < self.width and 0 <= point[1] < self.height
-
-    def get_value(self, point: Point) -> str:
-        """Get the value at a point."""
-        x, y = point
-        return self.data[y][x]
-
-    def neighbours(self, point: Point) -> Iterator[tuple[Point, Point]]:
+        self.slopes = {
+            ord(">"): grid.right,
+            ord("<"): grid.left,
+            ord("^"): grid.up,
+            ord("v"): grid.down,
+        }
+
+    def neighbours(self, point: int) -> Iterator[tuple[int, int]]:
         """Find the neighbours of a point."""
-        current_val = self.get_value(point)
-        if current_val in SLOPES and self.slippery:
-            d = SLOPES[current_val]
-            yield (point[0] + d[0], point[1] + d[1]), d
+        current_val = self.grid[point]
+        if current_val in self.slopes and self.slippery:
+            d = self.slopes[current_val]
+            yield point + d, d
             return
 
-        for d in DIRECTIONS:
-            new_point = (point[0] + d[0], point[1] + d[1])
-            if self.in_bounds(new_point):
-                val = self.get_value(new_point)
-                if (
-                    val == "."
-                    or SLOPES.get(val) == d
-                    or (val in SLOPES and not self.slippery)
-                ):
-                    yield new_point, d
-
-    def build_graph(
-        self, start: Point, end: Point
-    ) -> dict[Point, list[tuple[Point, int]]]:
+        for d in self.grid.directions:
+            new_point = point + d
+            val = self.grid[new_point]
+            if (
+                val == PATH
+                or self.slopes.get(val) == d
+                or (val in self.slopes and not self.slippery)
+            ):
+                yield new_point, d
+
+    def build_graph(self, start: int, end: int) -> dict[int, list[tuple[int, int]]]:
         """Build a graph between each intersection in the maze."""
         graph = defaultdict(list)
         to_process = deque([start])
@@ -70,10 +59,10 @@ class Grid:
         return graph
 
     def find_node(
-        self, start: Point, direction: Point, end: Point
-    ) -> tuple[Point, set[Point]] | None:
+        self, start: int, direction: int, end: int
+    ) -> tuple[int, set[int]] | None:
         """Find the next node in a path."""
-        next_node = (start[0] + direction[0], start[1] + direction[1])
+        next_node = start + direction
         visited = {start, next_node}
         while True:
             if next_node == end:
@@ -90,10 +79,10 @@ class Grid:
 
 
 def graph_longest_path(
-    graph: dict[Point, list[tuple[Point, int]]], start: Point, end: Point
+    graph: dict[int, list[tuple[int, int]]], start: int, end: int
 ) -> int:
     """Run BFS on the graph to find the longest path."""
-    queue = deque[tuple[Point, set[Point], int]]([(start, set(), 0)])
+    queue = deque[tuple[int, set[int], int]]([(start, set(), 0)])
     longest_path = 0
 
     while queue:
@@ -110,12 +99,12 @@ def graph_longest_path(
 
 def run(file: TextIO) -> Iterator[Any]:
     """Solution for Day 23."""
-    data = [list(line) for line in read_lines(file)]
-    p1_grid = Grid(data, True)
-    p2_grid = Grid(data, False)
+    grid = Grid.from_file(file)
+    p1_grid = Maze(grid, True)
+    p2_grid = Maze(grid, False)
 
-    start = (1, 0)
-    end = (p1_grid.width - 2, p1_grid.height - 1)
+    start = grid.index(1, 0)
+    end = grid.index(grid.width - 2, grid.height - 1)
 
     yield graph_longest_path(p1_grid.build_graph(start, end), start, end)
     yield graph_longest_path(p2_grid.build_graph(start, end), start, end)
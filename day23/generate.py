@@ -0,0 +1,121 @@
+"""Synthetic input generator for Day 23."""
+
+from math import isqrt
+from random import Random
+
+# The longest path search is exponential in the number of junctions, so only the
+# corridors between them grow with the scale
+MAX_JUNCTIONS = 5
+MIN_SIZE = 7
+MIN_CORRIDOR = 3
+# Chance of keeping a corridor that isn't needed to connect the maze
+EXTRA_CORRIDOR_CHANCE = 0.6
+# Chance of a corridor heading right taking a detour down, which changes how long
+# the downhill paths are
+DETOUR_CHANCE = 0.5
+
+Junction = tuple[int, int]
+
+
+def spaced_positions(count: int, size: int, rng: Random) -> list[int]:
+    """Pick count positions from 1 to size - 2, at least MIN_CORRIDOR apart."""
+    slack = size - 3 - (count - 1) * MIN_CORRIDOR
+    cuts = sorted(rng.randint(0, slack) for _ in range(count - 2))
+    gaps = [b - a for a, b in zip([0, *cuts], [*cuts, slack])]
+    positions = [1]
+    for gap in gaps:
+        positions.append(positions[-1] + MIN_CORRIDOR + gap)
+    return positions
+
+
+def pick_corridors(junctions: int, rng: Random) -> set[tuple[Junction, Junction]]:
+    """Pick which neighbouring junctions are joined, keeping the maze connected.
+
+    A staircase of right and down moves from the first junction to the last is
+    always kept, so the exit can still be reached going downhill.
+    """
+    moves = [(1, 0)] * (junctions - 1) + [(0, 1)] * (junctions - 1)
+    rng.shuffle(moves)
+    kept = set()
+    i = j = 0
+    for di, dj in moves:
+        kept.add(((i, j), (i + di, j + dj)))
+        i, j = i + di, j + dj
+
+    # Join everything else with a random spanning tree, plus some extra corridors
+    parent = {(i, j): (i, j) for i in range(junctions) for j in range(junctions)}
+
+    def find(junction: Junction) -> Junction:
+        while parent[junction] != junction:
+            junction = parent[junction] = parent[parent[junction]]
+        return junction
+
+    for a, b in kept:
+        parent[find(a)] = find(b)
+    others = [
+        ((i, j), (i + di, j + dj))
+        for i in range(junctions)
+        for j in range(junctions)
+        for di, dj in ((1, 0), (0, 1))
+        if i + di < junctions and j + dj < junctions
+    ]
+    rng.shuffle(others)
+    for a, b in others:
+        if find(a) != find(b):
+            parent[find(a)] = find(b)
+            kept.add((a, b))
+        elif rng.random() < EXTRA_CORRIDOR_CHANCE:
+            kept.add((a, b))
+    return kept
+
+
+def carve_right(
+    grid: list[list[str]], x: int, next_x: int, y: int, below: int, rng: Random
+) -> None:
+    """Carve a corridor heading right along row y, maybe with a detour down.
+
+    A detour stays clear of the row below, of the columns at either end and of
+    itself, so it never joins another corridor.
+    """
+    path = [(step_x, y) for step_x in range(x, next_x + 1)]
+    straight_end = next_x
+    if next_x - x >= 6 and below - y >= 3 and rng.random() < DETOUR_CHANCE:
+        straight_end = rng.randint(x + 2, next_x - 4)
+        rejoin = rng.randint(straight_end + 2, next_x - 2)
+        depth = rng.randint(1, below - y - 2)
+        path = [(step_x, y) for step_x in range(x, straight_end)]
+        path += [(straight_end, y + step_y) for step_y in range(depth)]
+        path += [(step_x, y + depth) for step_x in range(straight_end, rejoin)]
+        path += [(rejoin, y + step_y) for step_y in range(depth, 0, -1)]
+        path += [(step_x, y) for step_x in range(rejoin, next_x + 1)]
+    for step_x, step_y in path:
+        grid[step_y][step_x] = "."
+    grid[y][rng.randint(x + 1, straight_end - 1)] = ">"
+
+
+def generate(scale: int, rng: Random) -> str:
+    """Generate a square maze of about scale cells, of junctions joined by corridors.
+
+    The junctions sit on a lattice with randomly spaced rows and columns, and only
+    some of the neighbouring junctions are joined. Corridors heading right or down
+    have a slope part way along, so the icy maze can only be walked towards the
+    exit like the real puzzle, and some of them take a detour.
+    """
+    size = max(isqrt(scale), MIN_SIZE)
+    junctions = min(MAX_JUNCTIONS, (size - 3) // MIN_CORRIDOR + 1)
+    xs = spaced_positions(junctions, size, rng)
+    ys = spaced_positions(junctions, size, rng)
+    grid = [["#"] * size for _ in range(size)]
+    grid[0][1] = "."
+    grid[size - 1][size - 2] = "."
+    for (i, j), (next_i, next_j) in sorted(pick_corridors(junctions, rng)):
+        x, y = xs[i], ys[j]
+        next_x, next_y = xs[next_i], ys[next_j]
+        if next_i > i:
+            below = ys[j + 1] if j + 1 < junctions else y
+            carve_right(grid, x, next_x, y, below, rng)
+        else:
+            for step_y in range(y, next_y + 1):
+                grid[step_y][x] = "."
+            grid[rng.randint(y + 1, next_y - 1)][x] = "v"
+    return "\n".join("".join(row) for row in grid) + "\n"
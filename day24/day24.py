@@ -4,8 +4,6 @@ from dataclasses import dataclass
 from itertools import combinations
 from typing import Any, Iterator, TextIO
 
-from sympy import Symbol, solve_poly_system, symbols
-
 from utils.parse import read_lines
 
 Point = tuple[int, int, int]
@@ -56,6 +54,9 @@ def solve_equations(hailstones: list[Hailstone]) -> tuple[int, int, int]:
 
     We'll just use sympy.
     """
+    # sympy is slow to import, so only pay for it when part 2 is actually run
+    from sympy import Symbol, solve_poly_system, symbols
+
     position = symbols(["x", "y", "z"])
     velocity = symbols(["dx", "dy", "dz"])
 
@@ -0,0 +1,34 @@
+"""Synthetic input generator for Day 24."""
+
+from random import Random
+
+# Part 1 checks every pair of hailstones, so it's quadratic in the scale
+DEFAULT_SCALE = 200
+LOWER = 200000000000000
+UPPER = 400000000000000
+
+
+def nonzero(rng: Random, bound: int) -> int:
+    """Pick a random non-zero int in [-bound, bound]."""
+    return rng.choice([-1, 1]) * rng.randint(1, bound)
+
+
+def generate(scale: int, rng: Random) -> str:
+    """Generate scale hailstones that a single thrown rock hits."""
+    rock_position = [rng.randint(LOWER, UPPER) for _ in range(3)]
+    rock_velocity = [nonzero(rng, 300) for _ in range(3)]
+    lines = []
+    for _ in range(scale):
+        t = rng.randint(1, 10**12)
+        velocity = [nonzero(rng, 300) for _ in range(3)]
+        while velocity == rock_velocity:
+            velocity = [nonzero(rng, 300) for _ in range(3)]
+        position = [
+            p + (rv - v) * t for p, rv, v in zip(rock_position, rock_velocity, velocity)
+        ]
+        lines.append(
+            ", ".join(str(c) for c in position)
+            + " @ "
+            + ", ".join(str(c) for c in velocity)
+        )
+    return "\n".join(lines) + "\n"
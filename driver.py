@@ -1,12 +1,30 @@
 """The driver program that is the main entrypoint for the application."""
 import importlib
+import json
+import sys
 from datetime import datetime
 from pathlib import Path
+from time import perf_counter
+from typing import Any
 
 import click
-from cookiecutter.main import cookiecutter
 
-from driver_helpers.aoc_site import download_problem_input
+from driver_helpers.aoc_site import prefetch_inputs, save_problem_input
+from driver_helpers.budget import load_budgets_if_present, run_within_budgets
+from driver_helpers.result_cache import ResultCache, cache_key
+from driver_helpers.runner import (
+    PART_COUNT,
+    DayResult,
+    PartResult,
+    available_days,
+    day_module_name,
+    day_string,
+    format_rows,
+    format_table,
+    input_path,
+    open_input,
+    solution_days,
+)
 
 YEAR = 2023
 CURR_DAY = datetime.now().day
@@ -21,30 +39,413 @@ def cli() -> None:
 @click.argument("day", default=CURR_DAY)
 def bootstrap(day: int) -> None:
     """Initialize a new folder for a day using the template and download the input."""
+    from cookiecutter.main import cookiecutter
+
     day_str = str(day).zfill(2)
     cookiecutter("./template", extra_context={"day": day_str}, no_input=True)
-    with (Path(f"day{day_str}") / "input").open("wb") as fout:
-        download_problem_input(fout, YEAR, day)
+    save_problem_input(Path(f"day{day_str}") / "input", YEAR, day)
 
 
 @cli.command()
 @click.argument("day", default=CURR_DAY)
 @click.option("-i", "--input-file", "input_file_name", default="input")
-def run(day: int, input_file_name: str) -> None:
+@click.option("--stats", is_flag=True, help="Report time and memory used by each part.")
+@click.option("--top", default=5, help="Allocating lines to show with --stats.")
+@click.option("--no-cache", is_flag=True, help="Always rerun the solution.")
+def run(day: int, input_file_name: str, stats: bool, top: int, no_cache: bool) -> None:
     """Run the problem on the provided day."""
     day_str = str(day).zfill(2)
     input_file = Path(f"day{day_str}") / input_file_name
     if input_file_name == "input" and not input_file.is_file():
-        with input_file.open("wb") as fout:
-            download_problem_input(fout, YEAR, day)
+        save_problem_input(input_file, YEAR, day)
+
+    # Stats need the solution to actually run, so they skip the cache
+    cache = None if no_cache or stats else ResultCache()
+    key = cache_key(day, input_file) if cache is not None else ""
+    cached_parts = cache.get(key) if cache is not None else None
+    if cached_parts is not None:
+        for part_num, part in enumerate(cached_parts, start=1):
+            print(f"Part {part_num} (cached):")
+            print(part.answer)
+        return
 
+    parts = []
     module = importlib.import_module(f"day{day_str}.day{day_str}")
-    with open(input_file, "r", encoding="utf-8") as fin:
+    with open_input(module, input_file) as fin:
         iterator = module.run(fin)
-        print("Part 1:")
-        print(next(iterator, None))
-        print("Part 2:")
-        print(next(iterator, None))
+        for part_num in range(1, PART_COUNT + 1):
+            print(f"Part {part_num}:")
+            if stats:
+                # Tooling is imported lazily to keep startup fast for plain runs
+                from driver_helpers.stats import format_usage, measure_part
+
+                answer, usage = measure_part(iterator, top)
+                print(answer)
+                print(format_usage(usage))
+            else:
+                start = perf_counter()
+                answer = next(iterator, None)
+                parts.append(PartResult(answer, perf_counter() - start))
+                print(answer)
+
+    if cache is not None:
+        cache.put(key, day, parts)
+
+
+@cli.command("run-all")
+@click.argument("days", nargs=-1, type=int)
+@click.option("-i", "--input-file", "input_file_name", default="input")
+@click.option("-w", "--workers", type=int, default=None, help="Defaults to CPU count.")
+@click.option(
+    "--import-time", is_flag=True, help="Also report the import cost of each day."
+)
+@click.option("--no-cache", is_flag=True, help="Rerun days even if cached.")
+@click.option(
+    "--budgets",
+    "budget_file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Time and memory budgets. Defaults to budgets.json if it exists.",
+)
+def run_all_command(
+    days: tuple[int, ...],
+    input_file_name: str,
+    workers: int,
+    import_time: bool,
+    no_cache: bool,
+    budget_file: Path | None,
+) -> None:
+    """Run every day (or the provided days) in parallel and print a timing table."""
+    if not days:
+        days = tuple(available_days(input_file_name))
+    jobs = [(day, input_path(day, input_file_name)) for day in days]
+
+    start = perf_counter()
+    cache = None if no_cache else ResultCache()
+    keys = {}
+    results = []
+    pending_jobs = []
+    for day, input_file in jobs:
+        cached_parts = None
+        if cache is not None and input_file.is_file():
+            keys[day, input_file] = cache_key(day, input_file)
+            cached_parts = cache.get(keys[day, input_file])
+        if cached_parts is None:
+            pending_jobs.append((day, input_file))
+        else:
+            results.append(DayResult(day, input_file, cached_parts, cached=True))
+
+    default_budget, budgets = load_budgets_if_present(budget_file)
+    budgeted_jobs = [
+        (day, input_file, budgets.get(day, default_budget))
+        for day, input_file in pending_jobs
+    ]
+    for result in run_within_budgets(budgeted_jobs, workers):
+        results.append(result)
+        key = keys.get((result.day, result.input_file))
+        if cache is not None and key is not None and result.error is None:
+            cache.put(key, result.day, result.parts)
+
+    results.sort(key=lambda result: result.day)
+    wall_time = perf_counter() - start
+
+    print(format_table(results))
+    print()
+    print(f"Solver time: {sum(result.elapsed for result in results):.3f}s")
+    print(f"Wall time: {wall_time:.3f}s")
+
+    if import_time:
+        print()
+        print_import_times(["driver"] + [day_module_name(day) for day in days])
+
+
+def print_import_times(module_names: list[str]) -> None:
+    """Print how long each module takes to import in a fresh interpreter."""
+    from driver_helpers.import_time import (
+        heaviest_packages,
+        module_import_times,
+        total_import_time,
+    )
+
+    rows = [["Module", "Import (ms)", "Heaviest packages"]]
+    for module_name in module_names:
+        timings = module_import_times(module_name)
+        heaviest = ", ".join(
+            f"{package} {us / 1000:.1f}ms"
+            for package, us in heaviest_packages(timings, 3)
+        )
+        rows.append([module_name, f"{total_import_time(timings) / 1000:.1f}", heaviest])
+    print(format_rows(rows))
+
+
+@cli.command()
+@click.argument("days", nargs=-1, type=int)
+@click.option("-i", "--input-file", "input_file_name", default="input")
+@click.option("-n", "--repeat", default=10, help="Timed runs per day.")
+@click.option("--warmup", default=1, help="Untimed runs before timing starts.")
+@click.option("-o", "--output", type=click.Path(path_type=Path), default=None)
+@click.option("-b", "--baseline", type=click.Path(path_type=Path), default=None)
+@click.option("-t", "--tolerance", default=0.1, help="Allowed slowdown of the median.")
+@click.option(
+    "--scale", type=int, default=None, help="Use generated inputs of this scale."
+)
+@click.option("-s", "--seed", default=0, help="Seed for generated inputs.")
+@click.option("--record", is_flag=True, help="Store the answers as the known answers.")
+def bench(
+    days: tuple[int, ...],
+    input_file_name: str,
+    repeat: int,
+    warmup: int,
+    output: Path | None,
+    baseline: Path | None,
+    tolerance: float,
+    scale: int | None,
+    seed: int,
+    record: bool,
+) -> None:
+    """Benchmark every day (or the provided days), optionally against a baseline.
+
+    Answers on input files are checked against the known answers for each day.
+    """
+    from driver_helpers.bench import (
+        bench_data,
+        bench_day,
+        find_regressions,
+        format_stats,
+        load_baseline,
+        save_baseline,
+    )
+    from driver_helpers.golden import check_answers, record_answers
+    from driver_helpers.scaling import generate_input, generator_days
+
+    if not days:
+        days = tuple(
+            generator_days() if scale is not None else available_days(input_file_name)
+        )
+    results = {}
+    wrong_answers = []
+    for day in days:
+        if scale is None:
+            stats, answers = bench_day(
+                day, input_path(day, input_file_name), repeat, warmup
+            )
+            if record:
+                record_answers(day, input_file_name, answers)
+            wrong_answers.extend(check_answers(day, input_file_name, answers))
+        else:
+            try:
+                data = generate_input(day, scale, seed).encode("utf-8")
+            except NotImplementedError as e:
+                print(f"Skipping day {day}: {e}")
+                continue
+            stats, _ = bench_data(day, data, repeat, warmup)
+        results[day] = stats
+    print(format_stats(results))
+
+    if output is not None:
+        save_baseline(output, results)
+    regressions = []
+    if baseline is not None:
+        regressions = find_regressions(load_baseline(baseline), results, tolerance)
+    for title, failures in [
+        ("Wrong answers", wrong_answers),
+        ("Regressions", regressions),
+    ]:
+        if failures:
+            print()
+            print(f"{title}:")
+            print("\n".join(failures))
+    if wrong_answers or regressions:
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("day", type=int)
+@click.argument("candidate")
+@click.option("-r", "--reference", default=None, help="Defaults to the solution.")
+@click.option("-g", "--generated", default=5, help="Generated inputs to compare on.")
+@click.option(
+    "--scale",
+    type=int,
+    default=None,
+    help="Scale of the generated inputs. Defaults to the day's DEFAULT_SCALE.",
+)
+@click.option("-s", "--seed", default=0, help="Seed of the first generated input.")
+@click.option("-n", "--repeat", default=3, help="Runs per input, keeping the best.")
+@click.option("-o", "--output", type=click.Path(path_type=Path), default=None)
+def diff(
+    day: int,
+    candidate: str,
+    reference: str | None,
+    generated: int,
+    scale: int | None,
+    seed: int,
+    repeat: int,
+    output: Path | None,
+) -> None:
+    """Check a new implementation of a day agrees with the old one, and time both.
+
+    Implementations are modules with a run function, named either in full or
+    relative to the day's folder (so "fast" means dayNN.fast).
+    """
+    from driver_helpers.differential import (
+        compare_implementations,
+        format_comparisons,
+        save_comparisons,
+    )
+    from driver_helpers.scaling import generator_days
+
+    if generated and day not in generator_days():
+        print(f"Day {day} has no generator, so only stored inputs are compared")
+        generated = 0
+    comparisons = compare_implementations(
+        day,
+        reference or day_module_name(day),
+        candidate,
+        generated,
+        scale,
+        seed,
+        repeat,
+    )
+    if generated and not any(
+        comparison.input_name.startswith("generated") for comparison in comparisons
+    ):
+        print(
+            f"Day {day}'s generator isn't written, so only stored inputs are compared"
+        )
+    print(format_comparisons(comparisons))
+
+    if output is not None:
+        save_comparisons(output, comparisons)
+    if not comparisons or not all(comparison.matches for comparison in comparisons):
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("day", default=CURR_DAY)
+@click.option("-i", "--input-file", "input_file_name", default="input")
+@click.option("-n", "--top", default=20, help="Functions to show for each part.")
+@click.option(
+    "-o", "--output-dir", type=click.Path(path_type=Path), default=Path("profiles")
+)
+def profile(day: int, input_file_name: str, top: int, output_dir: Path) -> None:
+    """Profile each part of a day, saving pstats and collapsed stack files."""
+    from driver_helpers.profiling import profile_solution, save_profiles
+
+    module = importlib.import_module(day_module_name(day))
+    with open_input(module, input_path(day, input_file_name)) as fin:
+        results = profile_solution(module, fin)
+
+    for part_num, (answer, stats) in enumerate(results, start=1):
+        print(f"Part {part_num}:")
+        print(answer)
+        stats.sort_stats("cumulative").print_stats(top)
+
+    for path in save_profiles(results, output_dir, f"day{day_string(day)}"):
+        print(f"Saved {path}")
+
+
+@cli.command()
+@click.argument("days", nargs=-1, type=int)
+@click.option("-w", "--workers", default=5, help="Maximum concurrent downloads.")
+def prefetch(days: tuple[int, ...], workers: int) -> None:
+    """Download every missing input (or the inputs for the provided days)."""
+    if not days:
+        days = tuple(solution_days())
+    paths = {day: input_path(day) for day in days if not input_path(day).is_file()}
+
+    failed = False
+    for day, error in prefetch_inputs(paths, YEAR, workers):
+        if error is None:
+            print(f"Downloaded day {day}")
+        else:
+            print(f"Failed to download day {day}: {error}")
+            failed = True
+    if failed:
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("days", nargs=-1, type=int)
+@click.option("--host", default="127.0.0.1")
+@click.option("-p", "--port", default=8023)
+@click.option("-w", "--workers", type=int, default=None, help="Defaults to CPU count.")
+def serve(days: tuple[int, ...], host: str, port: int, workers: int | None) -> None:
+    """Solve jobs posted over HTTP using warm worker processes."""
+    from driver_helpers.service import serve as run_service
+
+    run_service(host, port, workers, list(days) or solution_days())
+
+
+@cli.command()
+@click.argument("day", type=int)
+@click.argument(
+    "directory", type=click.Path(exists=True, file_okay=False, path_type=Path)
+)
+@click.option("-w", "--workers", type=int, default=None, help="Defaults to CPU count.")
+@click.option(
+    "--budgets",
+    "budget_file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Time and memory budgets. Defaults to budgets.json if it exists.",
+)
+def batch(
+    day: int, directory: Path, workers: int | None, budget_file: Path | None
+) -> None:
+    """Run a day against every input file in a directory, printing JSON lines."""
+    input_files = sorted(
+        path
+        for path in directory.iterdir()
+        if path.is_file() and not path.name.startswith(".")
+    )
+    default_budget, budgets = load_budgets_if_present(budget_file)
+    budget = budgets.get(day, default_budget)
+    jobs = ((day, input_file, budget) for input_file in input_files)
+    for result in run_within_budgets(jobs, workers, preload_days=[day]):
+        line: dict[str, Any] = {"file": str(result.input_file)}
+        if result.error is not None:
+            line["error"] = result.error
+            line["over_budget"] = result.over_budget
+        else:
+            line["answers"] = [part.answer for part in result.parts]
+            line["timings"] = [part.elapsed for part in result.parts]
+        print(json.dumps(line, default=str), flush=True)
+
+
+@cli.command()
+@click.argument("day", type=int)
+@click.argument("scale", type=int)
+@click.option("-s", "--seed", default=0)
+@click.option("-o", "--output", type=click.Path(path_type=Path), default=None)
+def generate(day: int, scale: int, seed: int, output: Path | None) -> None:
+    """Generate a synthetic input for a day at the given scale."""
+    from driver_helpers.scaling import generate_input
+
+    data = generate_input(day, scale, seed)
+    if output is None:
+        print(data, end="")
+    else:
+        output.write_text(data, encoding="utf-8")
+
+
+@cli.command()
+@click.argument("day", type=int)
+@click.option("-b", "--base", default=100, help="The smallest scale to run.")
+@click.option("-n", "--steps", default=5, help="How many times to double the scale.")
+@click.option("-s", "--seed", default=0)
+@click.option("-r", "--repeat", default=3, help="Runs per scale, keeping the best.")
+def scale(day: int, base: int, steps: int, seed: int, repeat: int) -> None:
+    """Time a day on generated inputs of doubling size and fit the complexity."""
+    from driver_helpers.scaling import format_scaling, measure_scaling
+
+    scales = [base * 2**step for step in range(steps)]
+    try:
+        timings = measure_scaling(day, scales, seed, repeat)
+    except NotImplementedError as e:
+        print(f"Skipping day {day}: {e}")
+        sys.exit(1)
+    print(format_scaling(scales, timings))
 
 
 if __name__ == "__main__":
@@ -1,15 +1,23 @@
 """Helpers related to interacting with the AOC website."""
+import hashlib
 import json
 import os
 import sqlite3
+from contextlib import suppress
+from functools import cache
 from pathlib import Path
-from typing import BinaryIO
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING, BinaryIO, Iterator
 
-import requests
+if TYPE_CHECKING:
+    import requests
 
-INPUT_URL = "https://adventofcode.com/{year}/day/{day}/input"
+BASE_URL = "https://adventofcode.com"
+INPUT_PATH = "/{year}/day/{day}/input"
 COOKIE_HOST = ".adventofcode.com"
 COOKIE_NAME = "session"
+CACHE_DIR = Path() / ".aoc_cache"
+TIMEOUT = 30
 
 
 def get_firefox_session() -> str:
@@ -54,15 +62,157 @@ def get_session_cookie_from_db(sqlite_file: Path) -> str:
         conn.close()
 
 
-def download_problem_input(filelike: BinaryIO, year: int, day: int) -> None:
-    """Download the input file for a problem."""
+@cache
+def get_session_token() -> str:
+    """Find the session token, looking it up only once per process."""
     config_path = Path() / "config.json"
     if config_path.exists():
-        session = json.loads(config_path.read_text())["Session"]
-    else:
-        session = get_firefox_session()
-    resp = requests.get(
-        INPUT_URL.format(year=year, day=day), cookies={"session": session}
+        return str(json.loads(config_path.read_text())["Session"])
+    return get_firefox_session()
+
+
+@cache
+def get_http_session() -> "requests.Session":
+    """Get a shared HTTP session that keeps connections alive and retries failures."""
+    # requests is slow to import and most runs never touch the network
+    import requests
+    from requests.adapters import HTTPAdapter, Retry
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    )
+    http_session = requests.Session()
+    http_session.mount("http://", HTTPAdapter(max_retries=retry))
+    http_session.mount("https://", HTTPAdapter(max_retries=retry))
+    return http_session
+
+
+def write_atomic(path: Path, content: bytes) -> None:
+    """Write a file so that readers only ever see the old or the complete new file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", delete=False
+    ) as f:
+        f.write(content)
+    os.replace(f.name, path)
+
+
+class InputCache:
+    """A content addressed cache of problem inputs on disk.
+
+    Inputs are stored under the hash of their contents, with a small reference file
+    per (year, day) recording which hash belongs to that problem.
+    """
+
+    def __init__(self, cache_dir: Path = CACHE_DIR) -> None:
+        """Initialize with the directory to store the cache in."""
+        self.cache_dir = cache_dir
+
+    def object_path(self, digest: str) -> Path:
+        """Get the path an input with a given hash is stored at."""
+        return self.cache_dir / "objects" / digest[:2] / digest
+
+    def ref_path(self, year: int, day: int) -> Path:
+        """Get the path of the file holding the hash of a problem's input."""
+        return self.cache_dir / "refs" / str(year) / str(day).zfill(2)
+
+    def get(self, year: int, day: int) -> bytes | None:
+        """Get a cached input, or None if it is missing or corrupt."""
+        try:
+            digest = self.ref_path(year, day).read_text(encoding="ascii").strip()
+            content = self.object_path(digest).read_bytes()
+        except FileNotFoundError:
+            return None
+        if hashlib.sha256(content).hexdigest() != digest:
+            return None
+        return content
+
+    def put(self, year: int, day: int, content: bytes) -> str:
+        """Store an input in the cache, returning its hash."""
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self.object_path(digest)
+        if not object_path.is_file():
+            write_atomic(object_path, content)
+        write_atomic(self.ref_path(year, day), digest.encode("ascii"))
+        return digest
+
+
+def fetch_problem_input(year: int, day: int, base_url: str = BASE_URL) -> bytes:
+    """Fetch the input for a problem from the website."""
+    resp = get_http_session().get(
+        base_url + INPUT_PATH.format(year=year, day=day),
+        cookies={"session": get_session_token()},
+        timeout=TIMEOUT,
     )
     resp.raise_for_status()
-    filelike.write(resp.content)
+    return resp.content
+
+
+def get_problem_input(
+    year: int, day: int, cache_dir: Path = CACHE_DIR, base_url: str = BASE_URL
+) -> bytes:
+    """Get the input for a problem, only going to the website if it isn't cached."""
+    input_cache = InputCache(cache_dir)
+    content = input_cache.get(year, day)
+    if content is None:
+        content = fetch_problem_input(year, day, base_url)
+        input_cache.put(year, day, content)
+    return content
+
+
+def download_problem_input(
+    filelike: BinaryIO,
+    year: int,
+    day: int,
+    cache_dir: Path = CACHE_DIR,
+    base_url: str = BASE_URL,
+) -> None:
+    """Download the input file for a problem."""
+    filelike.write(get_problem_input(year, day, cache_dir, base_url))
+
+
+def save_problem_input(
+    path: Path,
+    year: int,
+    day: int,
+    cache_dir: Path = CACHE_DIR,
+    base_url: str = BASE_URL,
+) -> None:
+    """Download the input file for a problem, writing it to a path atomically."""
+    write_atomic(path, get_problem_input(year, day, cache_dir, base_url))
+
+
+def prefetch_inputs(
+    paths: dict[int, Path],
+    year: int,
+    workers: int,
+    cache_dir: Path = CACHE_DIR,
+    base_url: str = BASE_URL,
+) -> Iterator[tuple[int, Exception | None]]:
+    """Download the inputs for many days concurrently.
+
+    Yields each day as it finishes, along with the exception if it failed.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    input_cache = InputCache(cache_dir)
+    if any(input_cache.get(year, day) is None for day in paths):
+        # functools.cache doesn't stop threads that miss at the same time from each
+        # looking up the token and building a session, so do both before starting.
+        # A failure here is left for each download to report.
+        with suppress(Exception):
+            get_session_token()
+            get_http_session()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                save_problem_input, path, year, day, cache_dir, base_url
+            ): day
+            for day, path in paths.items()
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.exception()
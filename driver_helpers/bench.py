@@ -0,0 +1,121 @@
+"""Helpers for benchmarking solutions and comparing against stored baselines."""
+import importlib
+import json
+from dataclasses import asdict, dataclass
+from math import ceil
+from pathlib import Path
+from statistics import median
+from typing import Any
+
+from driver_helpers.runner import (
+    PART_COUNT,
+    day_module_name,
+    format_rows,
+    input_from_bytes,
+    run_parts,
+)
+
+
+@dataclass
+class PartStats:
+    """Summary statistics for the timings of one part."""
+
+    min: float
+    median: float
+    p95: float
+
+    @staticmethod
+    def from_timings(timings: list[float]) -> "PartStats":
+        """Summarise a list of timings."""
+        ordered = sorted(timings)
+        p95_index = max(ceil(len(ordered) * 0.95) - 1, 0)
+        return PartStats(ordered[0], median(ordered), ordered[p95_index])
+
+
+def bench_data(
+    day: int, data: bytes, repeat: int, warmup: int = 1
+) -> tuple[list[PartStats], list[Any]]:
+    """Time each part of a day repeatedly on an input, after some untimed runs.
+
+    Returns the timings along with the answers from the last run.
+    """
+    module = importlib.import_module(day_module_name(day))
+
+    timings: list[list[float]] = [[] for _ in range(PART_COUNT)]
+    answers: list[Any] = []
+    for iteration in range(warmup + repeat):
+        parts = run_parts(module, input_from_bytes(module, data))
+        answers = [part.answer for part in parts]
+        if iteration < warmup:
+            continue
+        for part_timings, part in zip(timings, parts):
+            part_timings.append(part.elapsed)
+
+    return [PartStats.from_timings(part_timings) for part_timings in timings], answers
+
+
+def bench_day(
+    day: int, input_file: Path, repeat: int, warmup: int = 1
+) -> tuple[list[PartStats], list[Any]]:
+    """Time each part of a day repeatedly on an input file.
+
+    The module is imported and the input read once, so only the solution is measured.
+    """
+    return bench_data(day, input_file.read_bytes(), repeat, warmup)
+
+
+def save_baseline(path: Path, results: dict[int, list[PartStats]]) -> None:
+    """Write benchmark results to a JSON baseline file."""
+    data = {
+        str(day): [asdict(part_stats) for part_stats in stats]
+        for day, stats in results.items()
+    }
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def load_baseline(path: Path) -> dict[int, list[PartStats]]:
+    """Read benchmark results from a JSON baseline file."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {
+        int(day): [PartStats(**part_stats) for part_stats in stats]
+        for day, stats in data.items()
+    }
+
+
+def find_regressions(
+    baseline: dict[int, list[PartStats]],
+    results: dict[int, list[PartStats]],
+    tolerance: float,
+) -> list[str]:
+    """Describe every part whose median time grew by more than the tolerance."""
+    regressions = []
+    for day, stats in sorted(results.items()):
+        if day not in baseline:
+            continue
+        for part_num, (old, new) in enumerate(zip(baseline[day], stats), start=1):
+            if new.median > old.median * (1 + tolerance):
+                regressions.append(
+                    f"Day {day} part {part_num}: "
+                    f"{old.median:.4f}s -> {new.median:.4f}s "
+                    f"({new.median / old.median - 1:+.1%})"
+                )
+    return regressions
+
+
+def format_stats(results: dict[int, list[PartStats]]) -> str:
+    """Format benchmark results into a table."""
+    header = ["Day", "Part", "Min (s)", "Median (s)", "P95 (s)"]
+    rows = [header]
+    for day, stats in sorted(results.items()):
+        for part_num, part_stats in enumerate(stats, start=1):
+            rows.append(
+                [
+                    str(day),
+                    str(part_num),
+                    f"{part_stats.min:.4f}",
+                    f"{part_stats.median:.4f}",
+                    f"{part_stats.p95:.4f}",
+                ]
+            )
+
+    return format_rows(rows)
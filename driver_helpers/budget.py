@@ -0,0 +1,400 @@
+"""Helpers for running solutions within time and memory budgets."""
+import importlib
+import json
+import os
+import signal
+from collections import deque
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+from driver_helpers.runner import (
+    PART_COUNT,
+    DayResult,
+    PartResult,
+    day_module_name,
+    import_days,
+)
+from driver_helpers.shared_inputs import (
+    SharedInput,
+    SharedInputs,
+    open_shared,
+    source_path,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore[assignment]
+
+BUDGET_PATH = Path() / "budgets.json"
+# How long past its time budget a job may run before its worker is killed. Covers
+# starting the worker and loading the input, so it only catches solutions stuck
+# in code that never returns to Python, where SIGALRM can't stop them.
+WALL_CLOCK_GRACE = 5.0
+
+
+class BudgetExceeded(Exception):
+    """Raised when a solution runs past its time budget."""
+
+
+@dataclass
+class Budget:
+    """Limits on the resources a day may use. None means no limit."""
+
+    timeout: float | None = None
+    part_timeouts: list[float | None] = field(default_factory=list)
+    memory_mb: int | None = None
+
+    def part_timeout(self, part_num: int) -> float | None:
+        """Get the time limit for a single part, counting from one."""
+        if part_num <= len(self.part_timeouts):
+            return self.part_timeouts[part_num - 1]
+        return None
+
+    def total_timeout(self) -> float | None:
+        """Get the time limit for all the parts together."""
+        limits = []
+        if self.timeout is not None:
+            limits.append(self.timeout)
+        part_timeouts = [self.part_timeout(n) for n in range(1, PART_COUNT + 1)]
+        if None not in part_timeouts:
+            limits.append(sum(t for t in part_timeouts if t is not None))
+        return min(limits, default=None)
+
+
+def load_budgets(path: Path) -> tuple[Budget, dict[int, Budget]]:
+    """Load the default budget and the per-day budgets from a JSON file.
+
+    The file looks like {"default": {"timeout": 60}, "days": {"21": {...}}}, where
+    each budget may have "timeout", "part_timeouts" and "memory_mb". Days inherit
+    any limit they don't set from the default.
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    default_data = data.get("default", {})
+    default = Budget(**default_data)
+    days = {
+        int(day): Budget(**(default_data | day_data))
+        for day, day_data in data.get("days", {}).items()
+    }
+    return default, days
+
+
+@contextmanager
+def time_limit(seconds: float | None, description: str) -> Iterator[None]:
+    """Raise BudgetExceeded in the main thread if the block runs too long."""
+    if seconds is None or not hasattr(signal, "setitimer"):
+        yield
+        return
+
+    def on_alarm(signum: int, frame: Any) -> None:
+        raise BudgetExceeded(f"{description} ran out of time after {seconds:.3g}s")
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, max(seconds, 1e-3))
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+@contextmanager
+def memory_limit(megabytes: int | None) -> Iterator[None]:
+    """Limit the address space of this process, so allocations past it fail.
+
+    Only the soft limit is lowered, so it can be restored for the next job.
+    """
+    if megabytes is None or resource is None:
+        yield
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    limit = megabytes * 1024 * 1024
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    try:
+        yield
+    finally:
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def load_budgets_if_present(path: Path | None) -> tuple[Budget, dict[int, Budget]]:
+    """Load budgets from a file, or the default budget file if it exists.
+
+    With no budget file at all, nothing is limited.
+    """
+    if path is None:
+        if not BUDGET_PATH.is_file():
+            return Budget(), {}
+        path = BUDGET_PATH
+    return load_budgets(path)
+
+
+def solve_within_budget(
+    day: int, source: Path | SharedInput, budget: Budget
+) -> DayResult:
+    """Run the solution for a day, stopping it if it goes over its budget.
+
+    The input may be a file or an input in shared memory. Going over budget, like
+    any other failure, is recorded in the result rather than raised. This relies on
+    running in the main thread of a worker process.
+    """
+    result = DayResult(day, source_path(source))
+    try:
+        module = importlib.import_module(day_module_name(day))
+        with memory_limit(budget.memory_mb), open_shared(module, source) as fin:
+            with closing(module.run(fin)) as iterator:
+                day_start = perf_counter()
+                for part_num in range(1, PART_COUNT + 1):
+                    limits = [budget.part_timeout(part_num)]
+                    if budget.timeout is not None:
+                        limits.append(budget.timeout - (perf_counter() - day_start))
+                    limit = min((t for t in limits if t is not None), default=None)
+
+                    start = perf_counter()
+                    with time_limit(limit, f"Part {part_num}"):
+                        answer = next(iterator, None)
+                    result.parts.append(PartResult(answer, perf_counter() - start))
+    except BudgetExceeded as e:
+        result.error = str(e)
+        result.over_budget = True
+    except MemoryError:
+        result.error = "Ran out of memory"
+        if budget.memory_mb is not None:
+            result.error += f" with a {budget.memory_mb}MB budget"
+            result.over_budget = True
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+@dataclass
+class BudgetedJob:
+    """A job for the pool, with its input loaded into shared memory."""
+
+    day: int
+    input_file: Path
+    budget: Budget
+    shared: SharedInput
+    deadline: float | None = None
+    suspect: bool = False
+    timed_out: bool = False
+
+    def failure(self) -> DayResult:
+        """Get the result for this job when its worker died or was killed."""
+        result = DayResult(self.day, self.input_file, over_budget=self.timed_out)
+        if self.timed_out:
+            result.error = (
+                f"Still running {WALL_CLOCK_GRACE:.3g}s past its"
+                f" {self.budget.total_timeout():.3g}s budget, so its worker was killed"
+            )
+        else:
+            result.error = "The worker process died"
+        return result
+
+
+class BudgetedPool:
+    """Runs budgeted jobs on a process pool that survives its workers dying.
+
+    A worker dying (crashing, or being killed for running out of memory) breaks the
+    whole pool, failing every job in flight, so the pool is replaced. If it's not
+    clear which job killed its worker, the jobs that were in flight are retried one
+    at a time until the culprit is found, and only it fails.
+
+    The alarm in a worker can't interrupt code that never returns to Python, so a
+    job still running well past its time budget has the workers killed from here.
+    """
+
+    def __init__(
+        self, workers: int, preload_days: list[int], shared_inputs: SharedInputs
+    ) -> None:
+        """Initialize with the size of the pool and the days to import up front."""
+        self.workers = workers
+        self.preload_days = preload_days
+        self.shared_inputs = shared_inputs
+        self.executor = self.start_pool()
+        self.running: "dict[Future[DayResult], BudgetedJob]" = {}
+        self.retries: deque[BudgetedJob] = deque()
+        self.suspects: deque[BudgetedJob] = deque()
+
+    def start_pool(self) -> "ProcessPoolExecutor":
+        """Start a new pool of workers."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=import_days,
+            initargs=(self.preload_days,),
+        )
+
+    def replace_pool(self) -> None:
+        """Replace a broken pool, once every job on it has finished or failed."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.executor = self.start_pool()
+
+    def close(self) -> None:
+        """Shut down the pool, abandoning any jobs in flight."""
+        if self.running:
+            kill_workers(self.executor)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        for job in self.running.values():
+            self.shared_inputs.release(job.shared)
+        self.running.clear()
+
+    def submit(self, job: BudgetedJob) -> bool:
+        """Submit a job, returning False if the pool was found to be broken."""
+        from concurrent.futures.process import BrokenProcessPool
+
+        try:
+            future = self.executor.submit(
+                solve_within_budget, job.day, job.shared, job.budget
+            )
+        except BrokenProcessPool:
+            (self.suspects if job.suspect else self.retries).appendleft(job)
+            return False
+        limit = job.budget.total_timeout()
+        if limit is not None:
+            # Only one job per worker is in flight, so it starts once it's submitted
+            job.deadline = perf_counter() + limit + WALL_CLOCK_GRACE
+        self.running[future] = job
+        return True
+
+    def fill(self, jobs: Iterator[tuple[int, Path, Budget]]) -> Iterator[DayResult]:
+        """Submit jobs until every worker has one, yielding jobs that fail to load.
+
+        Suspects run alone, so if the pool breaks it's clear which job broke it.
+        """
+        healthy = True
+        if self.suspects and not self.running:
+            healthy = self.submit(self.suspects.popleft())
+        while (
+            healthy
+            and len(self.running) < self.workers
+            and not self.suspects
+            and not any(job.suspect for job in self.running.values())
+        ):
+            if self.retries:
+                healthy = self.submit(self.retries.popleft())
+                continue
+            new_job = next(jobs, None)
+            if new_job is None:
+                break
+            day, input_file, budget = new_job
+            try:
+                shared = self.shared_inputs.acquire(input_file)
+            except OSError as e:
+                yield DayResult(day, input_file, error=f"{type(e).__name__}: {e}")
+                continue
+            healthy = self.submit(BudgetedJob(day, input_file, budget, shared))
+        if not healthy and not self.running:
+            # A worker died between jobs, so there are no failed jobs to wait for
+            self.replace_pool()
+
+    def collect(self) -> Iterator[DayResult]:
+        """Wait for at least one job to finish, yielding the results."""
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        deadlines = [job.deadline for job in self.running.values() if job.deadline]
+        timeout = None
+        if deadlines:
+            timeout = max(min(deadlines) - perf_counter(), 0)
+        done, _ = wait(self.running, timeout, return_when=FIRST_COMPLETED)
+        if not done:
+            for job in self.running.values():
+                if job.deadline is not None and job.deadline <= perf_counter():
+                    job.timed_out = True
+            kill_workers(self.executor)
+            done = wait(self.running).done
+
+        broken: list[BudgetedJob] = []
+        for future in done:
+            yield from self.finish(future, broken)
+        if not broken:
+            return
+
+        # A dead worker fails every other job in flight too
+        for future in wait(self.running).done:
+            yield from self.finish(future, broken)
+        self.replace_pool()
+
+        culprits = [job for job in broken if job.timed_out]
+        if not culprits and len(broken) == 1:
+            culprits = broken
+        for job in broken:
+            if not culprits:
+                job.suspect = True
+                self.suspects.append(job)
+            elif job not in culprits:
+                self.retries.append(job)
+        for job in culprits:
+            self.shared_inputs.release(job.shared)
+            yield job.failure()
+
+    def finish(
+        self, future: "Future[DayResult]", broken: list[BudgetedJob]
+    ) -> Iterator[DayResult]:
+        """Stop tracking a finished job, yielding its result.
+
+        Jobs whose worker died are added to broken instead, keeping their input.
+        """
+        from concurrent.futures.process import BrokenProcessPool
+
+        job = self.running.pop(future)
+        error = future.exception()
+        if isinstance(error, BrokenProcessPool):
+            broken.append(job)
+            return
+        self.shared_inputs.release(job.shared)
+        if error is None:
+            yield future.result()
+        else:
+            # Such as an answer that can't be sent back from the worker
+            yield DayResult(
+                job.day, job.input_file, error=f"{type(error).__name__}: {error}"
+            )
+
+    def run(self, jobs: Iterable[tuple[int, Path, Budget]]) -> Iterator[DayResult]:
+        """Run (day, input file, budget) jobs, yielding each result as it finishes."""
+        job_iterator = iter(jobs)
+        try:
+            while True:
+                yield from self.fill(job_iterator)
+                if not self.running:
+                    if self.retries or self.suspects:
+                        continue
+                    return
+                yield from self.collect()
+        finally:
+            self.close()
+
+
+def kill_workers(executor: "ProcessPoolExecutor") -> None:
+    """Kill every worker in a pool, which breaks it."""
+    # There's no public way to stop a job once a worker has started it
+    for process in list(executor._processes.values()):
+        process.kill()
+
+
+def run_within_budgets(
+    jobs: Iterable[tuple[int, Path, Budget]],
+    workers: int | None = None,
+    preload_days: Iterable[int] = (),
+) -> Iterator[DayResult]:
+    """Run (day, input file, budget) jobs on a process pool, yielding each result.
+
+    Inputs reach the workers through shared memory. Only one job per worker is
+    submitted at a time, and each input is loaded just before its job and freed
+    once it's done, so only the inputs of jobs in flight are held. An input that
+    can't be read, like a worker that dies, fails its own job rather than the whole
+    run.
+    """
+    workers = workers or os.cpu_count() or 1
+    with SharedInputs() as shared_inputs:
+        pool = BudgetedPool(workers, list(preload_days), shared_inputs)
+        yield from pool.run(jobs)
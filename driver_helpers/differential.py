@@ -0,0 +1,182 @@
+"""Helpers for checking that a new implementation of a day agrees with the old one."""
+import importlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from driver_helpers.golden import load_answers, normalize
+from driver_helpers.runner import (
+    day_string,
+    format_rows,
+    input_from_bytes,
+    input_path,
+    run_parts,
+)
+from driver_helpers.scaling import default_scale, generate_input
+
+
+@dataclass
+class Comparison:
+    """The answers and best times of two implementations on one input."""
+
+    input_name: str
+    reference_answers: list[Any]
+    candidate_answers: list[Any]
+    reference_time: float
+    candidate_time: float
+    expected_answers: list[Any] | None = None
+    error: str | None = None
+
+    @property
+    def matches(self) -> bool:
+        """Whether the candidate agrees with the reference and the known answers."""
+        if self.error is not None:
+            return False
+        candidate = [normalize(answer) for answer in self.candidate_answers]
+        reference = [normalize(answer) for answer in self.reference_answers]
+        if candidate != reference:
+            return False
+        return self.expected_answers is None or all(
+            expected is None or expected == answer
+            for expected, answer in zip(self.expected_answers, candidate)
+        )
+
+    @property
+    def speedup(self) -> float | None:
+        """How many times faster the candidate is than the reference."""
+        if self.error is not None or self.candidate_time == 0:
+            return None
+        return self.reference_time / self.candidate_time
+
+
+def implementation_module(day: int, name: str) -> ModuleType:
+    """Import an implementation of a day, named in full or within the day's folder."""
+    if "." not in name:
+        name = f"day{day_string(day)}.{name}"
+    return importlib.import_module(name)
+
+
+def time_implementation(
+    module: ModuleType, data: bytes, repeat: int
+) -> tuple[list[Any], float]:
+    """Run an implementation repeatedly, returning its answers and best total time."""
+    answers: list[Any] = []
+    best = float("inf")
+    for _ in range(repeat):
+        parts = run_parts(module, input_from_bytes(module, data))
+        answers = [part.answer for part in parts]
+        best = min(best, sum(part.elapsed for part in parts))
+    return answers, best
+
+
+def compare_on(
+    reference: ModuleType,
+    candidate: ModuleType,
+    input_name: str,
+    data: bytes,
+    repeat: int,
+    expected_answers: list[Any] | None = None,
+) -> Comparison:
+    """Compare two implementations on one input, recording any exception."""
+    comparison = Comparison(input_name, [], [], 0, 0, expected_answers)
+    try:
+        comparison.reference_answers, comparison.reference_time = time_implementation(
+            reference, data, repeat
+        )
+        comparison.candidate_answers, comparison.candidate_time = time_implementation(
+            candidate, data, repeat
+        )
+    except Exception as e:
+        comparison.error = f"{type(e).__name__}: {e}"
+    return comparison
+
+
+def compare_implementations(
+    day: int,
+    reference_name: str,
+    candidate_name: str,
+    generated: int,
+    scale: int | None,
+    seed: int,
+    repeat: int,
+) -> list[Comparison]:
+    """Compare two implementations of a day on its stored and generated inputs.
+
+    The stored inputs are the day's input file and any other file with known answers.
+    Generated inputs use consecutive seeds starting from seed, at the day's default
+    scale if no scale is given. None are generated if the generator isn't written.
+    """
+    reference = implementation_module(day, reference_name)
+    candidate = implementation_module(day, candidate_name)
+    known_answers = load_answers(day)
+
+    comparisons = []
+    for input_name in sorted({"input"} | known_answers.keys()):
+        path = input_path(day, input_name)
+        if path.is_file():
+            comparisons.append(
+                compare_on(
+                    reference,
+                    candidate,
+                    str(path),
+                    path.read_bytes(),
+                    repeat,
+                    known_answers.get(input_name),
+                )
+            )
+    for input_seed in range(seed, seed + generated):
+        input_scale = default_scale(day) if scale is None else scale
+        try:
+            data = generate_input(day, input_scale, input_seed).encode("utf-8")
+        except NotImplementedError:
+            # The day's generator is still the stub from the template
+            break
+        comparisons.append(
+            compare_on(
+                reference,
+                candidate,
+                f"generated scale={input_scale} seed={input_seed}",
+                data,
+                repeat,
+            )
+        )
+    return comparisons
+
+
+def format_comparisons(comparisons: list[Comparison]) -> str:
+    """Format comparisons into a table, describing any disagreement below it."""
+    rows = [["Input", "Match", "Reference (s)", "Candidate (s)", "Speedup"]]
+    details = []
+    for comparison in comparisons:
+        speedup = comparison.speedup
+        rows.append(
+            [
+                comparison.input_name,
+                "yes" if comparison.matches else "NO",
+                f"{comparison.reference_time:.4f}",
+                f"{comparison.candidate_time:.4f}",
+                "-" if speedup is None else f"{speedup:.2f}x",
+            ]
+        )
+        if comparison.error is not None:
+            details.append(f"{comparison.input_name}: {comparison.error}")
+        elif not comparison.matches:
+            details.append(
+                f"{comparison.input_name}: "
+                f"reference {comparison.reference_answers}, "
+                f"candidate {comparison.candidate_answers}, "
+                f"expected {comparison.expected_answers}"
+            )
+    return "\n".join([format_rows(rows)] + details)
+
+
+def save_comparisons(path: Path, comparisons: list[Comparison]) -> None:
+    """Write comparisons, with their speedups, to a JSON file."""
+    data = [
+        asdict(comparison)
+        | {"matches": comparison.matches, "speedup": comparison.speedup}
+        for comparison in comparisons
+    ]
+    path.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
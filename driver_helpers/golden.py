@@ -0,0 +1,53 @@
+"""Helpers for checking answers against the known good answers stored for each day."""
+import json
+from pathlib import Path
+from typing import Any
+
+from driver_helpers.runner import day_string
+
+ANSWERS_FILE_NAME = "answers.json"
+
+
+def answers_path(day: int) -> Path:
+    """Get the path of the file holding the known good answers for a day."""
+    return Path(f"day{day_string(day)}") / ANSWERS_FILE_NAME
+
+
+def load_answers(day: int) -> dict[str, list[Any]]:
+    """Load the known good answers for a day, keyed on input file name.
+
+    A null answer is one that isn't known yet, so it's never checked.
+    """
+    path = answers_path(day)
+    if not path.is_file():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def normalize(answer: Any) -> Any:
+    """Convert an answer to the form it takes once stored as JSON."""
+    if answer is None or isinstance(answer, (int, str)):
+        # Skips the round trip, which can't handle ints with thousands of digits
+        return answer
+    return json.loads(json.dumps(answer, default=str))
+
+
+def record_answers(day: int, input_file_name: str, answers: list[Any]) -> None:
+    """Store answers as the known good answers for an input file."""
+    known = load_answers(day)
+    known[input_file_name] = [normalize(answer) for answer in answers]
+    answers_path(day).write_text(json.dumps(known, indent=4) + "\n", encoding="utf-8")
+
+
+def check_answers(day: int, input_file_name: str, answers: list[Any]) -> list[str]:
+    """Describe every answer that differs from the known good answer."""
+    expected_answers = load_answers(day).get(input_file_name, [])
+    mismatches = []
+    for part_num, (expected, answer) in enumerate(
+        zip(expected_answers, answers), start=1
+    ):
+        if expected is not None and normalize(answer) != expected:
+            mismatches.append(
+                f"Day {day} part {part_num}: expected {expected}, got {answer}"
+            )
+    return mismatches
@@ -0,0 +1,72 @@
+"""Helpers for measuring how long modules take to import."""
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import cache
+
+
+@dataclass
+class ImportTiming:
+    """One line of `python -X importtime` output."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_import_times(output: str) -> list[ImportTiming]:
+    """Parse the output of `python -X importtime`."""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if not self_us.strip().isdigit():
+            # The header line
+            continue
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        timings.append(
+            ImportTiming(name.strip(), int(self_us), int(cumulative_us), depth)
+        )
+    return timings
+
+
+def run_with_import_times(code: str) -> list[ImportTiming]:
+    """Run code in a fresh interpreter, returning every import it did."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_import_times(proc.stderr)
+
+
+@cache
+def startup_modules() -> set[str]:
+    """Get the modules imported by the interpreter before any code runs."""
+    return {timing.name for timing in run_with_import_times("pass")}
+
+
+def module_import_times(module_name: str) -> list[ImportTiming]:
+    """Import a module in a fresh interpreter, returning the imports it caused."""
+    return [
+        timing
+        for timing in run_with_import_times(f"import {module_name}")
+        if timing.name not in startup_modules()
+    ]
+
+
+def total_import_time(timings: list[ImportTiming]) -> int:
+    """Get the total time in microseconds spent on a list of imports."""
+    return sum(timing.self_us for timing in timings)
+
+
+def heaviest_packages(timings: list[ImportTiming], count: int) -> list[tuple[str, int]]:
+    """Get the top level packages that took the longest to import, in microseconds."""
+    packages = defaultdict[str, int](int)
+    for timing in timings:
+        packages[timing.name.split(".")[0]] += timing.self_us
+    return sorted(packages.items(), key=lambda item: item[1], reverse=True)[:count]
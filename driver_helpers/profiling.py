@@ -0,0 +1,97 @@
+"""Helpers for profiling solutions and exporting the results."""
+import cProfile
+import pstats
+from collections import defaultdict
+from pathlib import Path
+from types import ModuleType
+from typing import IO, Any, Iterator
+
+from driver_helpers.runner import PART_COUNT
+
+Function = tuple[str, int, str]
+
+# Stacks contributing less than this many seconds are dropped from flame graphs
+MIN_STACK_TIME = 1e-6
+
+
+def profile_part(iterator: Iterator[Any]) -> tuple[Any, pstats.Stats]:
+    """Get the next answer from a solution under a deterministic profiler."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        answer = next(iterator, None)
+    finally:
+        profiler.disable()
+    return answer, pstats.Stats(profiler)
+
+
+def function_label(func: Function) -> str:
+    """Get a flame graph frame label for a profiled function."""
+    file_name, line, name = func
+    if file_name == "~":
+        return name
+    return f"{name} ({Path(file_name).name}:{line})"
+
+
+def collapsed_stacks(stats: pstats.Stats, root: str) -> Iterator[str]:
+    """Convert profile stats to collapsed stacks for flame graph tools.
+
+    cProfile only records caller/callee pairs, not whole stacks, so a function's time
+    is split between its callers in proportion to the time each caller spent in it.
+    Recursive calls are folded into the outermost call.
+    """
+    raw_stats = stats.stats  # type: ignore[attr-defined]
+    children = defaultdict[Function, list[tuple[Function, float]]](list)
+    for func, (_, _, _, _, callers) in raw_stats.items():
+        for caller, (_, _, _, cumulative_time) in callers.items():
+            children[caller].append((func, cumulative_time))
+
+    totals = defaultdict[str, float](float)
+
+    def walk(func: Function, stack: list[Function], share: float) -> None:
+        _, _, total_time, cumulative_time, _ = raw_stats[func]
+        if cumulative_time <= 0 or share < MIN_STACK_TIME:
+            return
+        scale = min(share / cumulative_time, 1)
+        totals[";".join([root] + [function_label(f) for f in stack])] += (
+            total_time * scale
+        )
+        for child, child_time in children[func]:
+            if child not in stack:
+                walk(child, stack + [child], child_time * scale)
+
+    for func, (_, _, _, cumulative_time, callers) in raw_stats.items():
+        if not callers:
+            walk(func, [func], cumulative_time)
+
+    for stack, seconds in totals.items():
+        microseconds = round(seconds * 1_000_000)
+        if microseconds > 0:
+            yield f"{stack} {microseconds}"
+
+
+def profile_solution(
+    module: ModuleType, file: IO[Any]
+) -> list[tuple[Any, pstats.Stats]]:
+    """Profile each part of a solution separately."""
+    iterator = module.run(file)
+    return [profile_part(iterator) for _ in range(PART_COUNT)]
+
+
+def save_profiles(
+    results: list[tuple[Any, pstats.Stats]], output_dir: Path, name: str
+) -> list[Path]:
+    """Save a pstats file per part and a combined collapsed stack file."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    collapsed = []
+    for part_num, (_, stats) in enumerate(results, start=1):
+        pstats_path = output_dir / f"{name}_part{part_num}.pstats"
+        stats.dump_stats(pstats_path)
+        paths.append(pstats_path)
+        collapsed.extend(collapsed_stacks(stats, f"part{part_num}"))
+
+    collapsed_path = output_dir / f"{name}.collapsed"
+    collapsed_path.write_text("\n".join(collapsed) + "\n", encoding="utf-8")
+    paths.append(collapsed_path)
+    return paths
@@ -0,0 +1,120 @@
+"""A persistent cache of answers, keyed on the input and the solution source."""
+import ast
+import hashlib
+import importlib.util
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+from driver_helpers.runner import PartResult, day_module_name
+
+RESULT_CACHE_PATH = Path() / ".aoc_cache" / "results.sqlite"
+MAX_CACHE_BYTES = 16 * 1024 * 1024
+
+
+def local_imports(source_path: Path) -> set[str]:
+    """Find the modules from the utils package that a source file imports."""
+    tree = ast.parse(source_path.read_text(encoding="utf-8"))
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module is not None:
+            names = [node.module]
+        else:
+            continue
+        modules.update(name for name in names if name.split(".")[0] == "utils")
+    return modules
+
+
+def module_path(module_name: str) -> Path:
+    """Find the source file of a module without importing it."""
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or spec.origin is None:
+        raise ModuleNotFoundError(module_name)
+    return Path(spec.origin)
+
+
+def source_digest(module_name: str) -> str:
+    """Hash the source of a module along with every utils module it depends on."""
+    paths = {}
+    to_visit = [module_name]
+    while to_visit:
+        name = to_visit.pop()
+        if name in paths:
+            continue
+        paths[name] = module_path(name)
+        to_visit.extend(local_imports(paths[name]))
+
+    digest = hashlib.sha256()
+    for name in sorted(paths):
+        digest.update(name.encode("utf-8"))
+        digest.update(paths[name].read_bytes())
+    return digest.hexdigest()
+
+
+def cache_key(day: int, input_file: Path) -> str:
+    """Get the cache key for running a day against an input file."""
+    input_digest = hashlib.sha256(input_file.read_bytes()).hexdigest()
+    return f"{input_digest}:{source_digest(day_module_name(day))}"
+
+
+class ResultCache:
+    """Answers and timings stored in SQLite, evicting the least recently used."""
+
+    def __init__(
+        self, path: Path = RESULT_CACHE_PATH, max_bytes: int = MAX_CACHE_BYTES
+    ) -> None:
+        """Open the cache, creating it if needed."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, day INTEGER, payload TEXT, last_used REAL)"
+        )
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        self.conn.close()
+
+    def get(self, key: str) -> list[PartResult] | None:
+        """Get the cached results for a key, if there are any."""
+        row = self.conn.execute(
+            "SELECT payload FROM results WHERE key=?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        with self.conn:
+            self.conn.execute(
+                "UPDATE results SET last_used=? WHERE key=?", (time.time(), key)
+            )
+        return [PartResult(answer, elapsed) for answer, elapsed in json.loads(row[0])]
+
+    def put(self, key: str, day: int, parts: list[PartResult]) -> None:
+        """Store the results for a key, then evict old entries if over the limit."""
+        payload = json.dumps(
+            [[part.answer, part.elapsed] for part in parts], default=str
+        )
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (key, day, payload, time.time()),
+            )
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete the least recently used entries until the cache fits its limit."""
+        total = 0
+        expired = []
+        for key, size in self.conn.execute(
+            "SELECT key, length(key) + length(payload) FROM results "
+            "ORDER BY last_used DESC"
+        ):
+            total += size
+            if total > self.max_bytes:
+                expired.append((key,))
+        if expired:
+            with self.conn:
+                self.conn.executemany("DELETE FROM results WHERE key=?", expired)
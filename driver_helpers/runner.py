@@ -0,0 +1,135 @@
+"""Helpers for running solutions and timing each part."""
+import importlib
+import io
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from types import ModuleType
+from typing import IO, Any, Iterable
+
+PART_COUNT = 2
+
+
+def day_string(day: int) -> str:
+    """Get the zero padded string used in folder and module names for a day."""
+    return str(day).zfill(2)
+
+
+def day_module_name(day: int) -> str:
+    """Get the name of the module containing the solution for a day."""
+    day_str = day_string(day)
+    return f"day{day_str}.day{day_str}"
+
+
+def input_path(day: int, input_file_name: str = "input") -> Path:
+    """Get the path of an input file for a day."""
+    return Path(f"day{day_string(day)}") / input_file_name
+
+
+def solution_days() -> list[int]:
+    """Find every day that has a solution."""
+    return [
+        int(folder.name.removeprefix("day"))
+        for folder in sorted(Path().glob("day[0-9][0-9]"))
+        if (folder / f"{folder.name}.py").is_file()
+    ]
+
+
+def available_days(input_file_name: str = "input") -> list[int]:
+    """Find every day that has a solution and the given input file."""
+    return [
+        day for day in solution_days() if input_path(day, input_file_name).is_file()
+    ]
+
+
+@dataclass
+class PartResult:
+    """The answer to one part of a problem and how long it took."""
+
+    answer: Any
+    elapsed: float
+
+
+@dataclass
+class DayResult:
+    """The results of running a solution against an input file."""
+
+    day: int
+    input_file: Path
+    parts: list[PartResult] = field(default_factory=list)
+    error: str | None = None
+    cached: bool = False
+    over_budget: bool = False
+
+    @property
+    def elapsed(self) -> float:
+        """Get the total time spent on all parts."""
+        return sum(part.elapsed for part in self.parts)
+
+
+def reads_bytes(module: ModuleType) -> bool:
+    """Check if a solution has opted in to reading its input as bytes.
+
+    Solutions opt in by setting INPUT_MODE = "bytes", and are then given a binary
+    file rather than a text file.
+    """
+    return getattr(module, "INPUT_MODE", "text") == "bytes"
+
+
+def open_input(module: ModuleType, input_file: Path) -> IO[Any]:
+    """Open an input file in the mode a solution expects."""
+    if reads_bytes(module):
+        return open(input_file, "rb")
+    return open(input_file, "r", encoding="utf-8")
+
+
+def input_from_bytes(module: ModuleType, data: bytes) -> IO[Any]:
+    """Wrap input held in memory in the kind of file a solution expects."""
+    if reads_bytes(module):
+        return io.BytesIO(data)
+    return io.StringIO(data.decode("utf-8"))
+
+
+def run_parts(module: ModuleType, file: IO[Any]) -> list[PartResult]:
+    """Drive a solution module's generator, timing each part."""
+    parts = []
+    # Closing the generator lets the solution release anything it holds open
+    with closing(module.run(file)) as iterator:
+        for _ in range(PART_COUNT):
+            start = perf_counter()
+            answer = next(iterator, None)
+            parts.append(PartResult(answer, perf_counter() - start))
+    return parts
+
+
+def import_days(days: Iterable[int]) -> None:
+    """Import the solutions for some days so later jobs don't pay for it."""
+    for day in days:
+        importlib.import_module(day_module_name(day))
+
+
+def format_table(results: Iterable[DayResult]) -> str:
+    """Format results into a table of answers and timings."""
+    header = ["Day", "Part 1", "Time (s)", "Part 2", "Time (s)", "Total (s)"]
+    rows = [header]
+    for result in results:
+        if result.error is not None:
+            rows.append([str(result.day), result.error] + [""] * (len(header) - 2))
+            continue
+        row = [str(result.day)]
+        for part in result.parts:
+            row.extend([str(part.answer), f"{part.elapsed:.3f}"])
+        row.append(f"{result.elapsed:.3f}" + (" (cached)" if result.cached else ""))
+        rows.append(row)
+
+    return format_rows(rows)
+
+
+def format_rows(rows: list[list[str]]) -> str:
+    """Format rows of cells into aligned columns."""
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    )
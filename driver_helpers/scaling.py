@@ -0,0 +1,105 @@
+"""Helpers for generating scaled inputs and measuring how solutions scale."""
+import importlib
+from math import log
+from pathlib import Path
+from random import Random
+from types import ModuleType
+
+from driver_helpers.runner import (
+    day_module_name,
+    day_string,
+    format_rows,
+    input_from_bytes,
+    run_parts,
+    solution_days,
+)
+
+DEFAULT_SCALE = 1000
+
+
+def generator_days() -> list[int]:
+    """Find every day that has a solution and an input generator."""
+    return [
+        day
+        for day in solution_days()
+        if (Path(f"day{day_string(day)}") / "generate.py").is_file()
+    ]
+
+
+def generator_module(day: int) -> ModuleType:
+    """Import the generate module for a day."""
+    return importlib.import_module(f"day{day_string(day)}.generate")
+
+
+def default_scale(day: int) -> int:
+    """Get the scale a day's inputs are generated at unless another is asked for.
+
+    Generators whose solutions do a lot of work per unit of scale set a smaller
+    DEFAULT_SCALE, so comparisons on several generated inputs stay quick.
+    """
+    return getattr(generator_module(day), "DEFAULT_SCALE", DEFAULT_SCALE)
+
+
+def generate_input(day: int, scale: int, seed: int) -> str:
+    """Generate a synthetic input for a day using its generate module."""
+    return generator_module(day).generate(scale, Random(seed))
+
+
+def time_generated(day: int, scale: int, seed: int, repeat: int) -> list[float]:
+    """Time each part of a day on a generated input, taking the best of repeat runs."""
+    module = importlib.import_module(day_module_name(day))
+    data = generate_input(day, scale, seed).encode("utf-8")
+    best: list[float] = []
+    for _ in range(repeat):
+        parts = run_parts(module, input_from_bytes(module, data))
+        timings = [part.elapsed for part in parts]
+        best = [min(a, b) for a, b in zip(best, timings)] if best else timings
+    return best
+
+
+def measure_scaling(
+    day: int, scales: list[int], seed: int, repeat: int
+) -> list[list[float]]:
+    """Time each part of a day at each scale.
+
+    Every measurement runs in a fresh process so caches in the solution (such as
+    functools.cache) from one scale can't speed up the next.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    timings = []
+    for scale in scales:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            timings.append(
+                executor.submit(time_generated, day, scale, seed, repeat).result()
+            )
+    return timings
+
+
+def fit_exponent(scales: list[int], timings: list[float]) -> float | None:
+    """Fit timings to c * scale^k with least squares in log space, returning k."""
+    points = [(log(s), log(t)) for s, t in zip(scales, timings) if t > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return covariance / variance
+
+
+def format_scaling(scales: list[int], timings: list[list[float]]) -> str:
+    """Format scaling timings with the fitted exponent for each part."""
+    part_count = len(timings[0]) if timings else 0
+    rows = [["Scale"] + [f"Part {i} (s)" for i in range(1, part_count + 1)]]
+    for scale, scale_timings in zip(scales, timings):
+        rows.append([str(scale)] + [f"{t:.4f}" for t in scale_timings])
+
+    exponents = ["Exponent"]
+    for part in range(part_count):
+        exponent = fit_exponent(scales, [t[part] for t in timings])
+        exponents.append("-" if exponent is None else f"{exponent:.2f}")
+    rows.append(exponents)
+    return format_rows(rows)
@@ -0,0 +1,187 @@
+"""A long lived service that solves problems on a pool of warm worker processes."""
+import importlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from driver_helpers.runner import (
+    PartResult,
+    day_module_name,
+    import_days,
+    input_from_bytes,
+    run_parts,
+)
+from driver_helpers.shared_inputs import SharedInput, SharedInputs, open_shared
+
+# How much memory inputs no job is using may keep in shared memory
+SHARED_INPUT_BYTES = 256 * 1024 * 1024
+DAY_FOLDER_PATTERN = re.compile(r"day\d\d")
+
+
+def checked_input_path(input_file: str) -> Path:
+    """Resolve the path of an input file, rejecting anything outside a day's folder.
+
+    Errors from solutions can quote their input, so reading any path a client sends
+    would let it read any file the service can.
+    """
+    root = Path().resolve()
+    path = Path(input_file).resolve()
+    if not path.is_relative_to(root):
+        raise ValueError(f"{input_file} isn't in a day's folder")
+    folders = path.relative_to(root).parts[:-1]
+    if len(folders) != 1 or not DAY_FOLDER_PATTERN.fullmatch(folders[0]):
+        raise ValueError(f"{input_file} isn't in a day's folder")
+    return path
+
+
+def start_pool(workers: int, days: list[int]) -> ProcessPoolExecutor:
+    """Start a pool of solver processes with the solutions for some days imported."""
+    executor = ProcessPoolExecutor(
+        max_workers=workers, initializer=import_days, initargs=(days,)
+    )
+    # Start every worker now rather than when the first jobs arrive
+    for future in [executor.submit(import_days, []) for _ in range(workers)]:
+        future.result()
+    return executor
+
+
+def solve_job(
+    day: int, shared: SharedInput | None, input_text: str | None
+) -> list[PartResult]:
+    """Solve a day for an input given either in shared memory or as the contents."""
+    module = importlib.import_module(day_module_name(day))
+    if shared is not None:
+        with open_shared(module, shared) as fin:
+            return run_parts(module, fin)
+    if input_text is not None:
+        return run_parts(module, input_from_bytes(module, input_text.encode("utf-8")))
+    raise ValueError("Expected either an input file or input text")
+
+
+class SolverServer(ThreadingHTTPServer):
+    """An HTTP server that hands jobs to a pool of solver processes."""
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        workers: int,
+        days: list[int],
+        shared_inputs: SharedInputs,
+    ) -> None:
+        """Initialize with the address to listen on and the pool to solve with.
+
+        Input files are loaded into shared memory once and read from there by every
+        worker that solves them. Inputs no job is using are kept for later jobs up to
+        a limit, after which the least recently used are freed.
+        """
+        self.workers = workers
+        self.days = days
+        self.executor = start_pool(workers, days)
+        self.pool_lock = threading.Lock()
+        self.shared_inputs = shared_inputs
+        super().__init__(address, SolverHandler)
+
+    def solve(
+        self, day: int, shared: SharedInput | None, input_text: str | None
+    ) -> list[PartResult]:
+        """Solve a job on the pool.
+
+        A worker that dies (crashing, or killed for running out of memory) breaks
+        the whole pool, so it's replaced for later jobs. The jobs it was running
+        still fail.
+        """
+        executor = self.executor
+        try:
+            return executor.submit(solve_job, day, shared, input_text).result()
+        except BrokenProcessPool:
+            with self.pool_lock:
+                # Only the first job to notice replaces the pool
+                if self.executor is executor:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    self.executor = start_pool(self.workers, self.days)
+            raise
+
+    def server_close(self) -> None:
+        """Stop listening and shut down the pool."""
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+
+
+class SolverHandler(BaseHTTPRequestHandler):
+    """Handle a job posted as JSON.
+
+    The body should look like {"day": 5, "input_file": "day05/input"} or
+    {"day": 5, "input": "<contents of the input>"}.
+    """
+
+    server: SolverServer
+
+    def do_POST(self) -> None:
+        """Solve the posted job and reply with the answers."""
+        start = perf_counter()
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            job = json.loads(self.rfile.read(length))
+            day = int(job["day"])
+            input_file = job.get("input_file")
+            input_text = job.get("input")
+            shared = None
+            if input_file is not None:
+                shared = self.server.shared_inputs.acquire(
+                    checked_input_path(input_file)
+                )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.reply(HTTPStatus.BAD_REQUEST, {"error": f"Invalid job: {e}"})
+            return
+
+        try:
+            parts = self.server.solve(day, shared, input_text)
+        except Exception as e:
+            self.reply(
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                {"day": day, "error": f"{type(e).__name__}: {e}"},
+            )
+            return
+        finally:
+            if shared is not None:
+                self.server.shared_inputs.release(shared)
+
+        self.reply(
+            HTTPStatus.OK,
+            {
+                "day": day,
+                "answers": [part.answer for part in parts],
+                "timings": [part.elapsed for part in parts],
+                "latency": perf_counter() - start,
+            },
+        )
+
+    def reply(self, status: HTTPStatus, body: dict[str, Any]) -> None:
+        """Send a JSON response."""
+        content = json.dumps(body, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+def serve(host: str, port: int, workers: int | None, days: list[int]) -> None:
+    """Serve jobs until interrupted, with the solutions for some days preloaded."""
+    workers = workers or os.cpu_count() or 1
+    with SharedInputs(SHARED_INPUT_BYTES) as shared_inputs, SolverServer(
+        (host, port), workers, days, shared_inputs
+    ) as server:
+        print(f"Serving on http://{host}:{server.server_port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,230 @@
+"""Helpers for sharing inputs between worker processes without copying them."""
+import io
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from types import ModuleType
+from typing import IO, Any, Iterator
+
+from driver_helpers.runner import open_input, reads_bytes
+
+NEWLINE_PATTERN = re.compile(rb"\n")
+
+
+@dataclass(frozen=True)
+class SharedInput:
+    """A handle to an input held in shared memory, cheap to send to a worker."""
+
+    name: str
+    size: int
+    path: Path
+
+
+@dataclass
+class SharedBlock:
+    """An input loaded into shared memory, and how many jobs are using it."""
+
+    block: SharedMemory
+    size: int
+    mtime_ns: int
+    users: int = 0
+
+
+class SharedInputs:
+    """Inputs loaded into shared memory, to be read by any number of workers.
+
+    Jobs acquire an input before they're submitted and release it when they finish.
+    Each file is held once however many jobs use it, and reloaded if it changes. An
+    input no job is using is freed straight away, unless max_bytes is set, in which
+    case unused inputs are kept for reuse until they'd take more than max_bytes,
+    freeing the least recently used first.
+
+    The store should be created before the worker processes, so they share its
+    resource tracker rather than starting their own, which would free the blocks
+    when the worker exits.
+    """
+
+    def __init__(self, max_bytes: int | None = None) -> None:
+        """Initialize an empty store."""
+        resource_tracker.ensure_running()
+        self.max_bytes = max_bytes
+        # The current block for each file, with the least recently used first
+        self.current: OrderedDict[Path, SharedBlock] = OrderedDict()
+        # Blocks replaced by a newer version of their file but still in use
+        self.stale: dict[str, SharedBlock] = {}
+        self.lock = threading.Lock()
+
+    def __enter__(self) -> "SharedInputs":
+        """Use the store as a context manager that frees every block on exit."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Free every block."""
+        self.close()
+
+    def acquire(self, path: Path) -> SharedInput:
+        """Get a handle to an input for a job, reading it in if it isn't loaded."""
+        stat = path.stat()
+        key = path.resolve()
+        with self.lock:
+            entry = self.current.get(key)
+            if entry is not None and (entry.mtime_ns, entry.size) != (
+                stat.st_mtime_ns,
+                stat.st_size,
+            ):
+                self.retire(self.current.pop(key))
+                entry = None
+            if entry is None:
+                entry = self.current[key] = load_block(path, stat.st_mtime_ns)
+            self.current.move_to_end(key)
+            entry.users += 1
+            return SharedInput(entry.block.name, entry.size, path)
+
+    def release(self, shared: SharedInput) -> None:
+        """Mark a job as done with an input, freeing inputs that are no longer kept."""
+        with self.lock:
+            stale = self.stale.get(shared.name)
+            if stale is not None:
+                stale.users -= 1
+                if stale.users == 0:
+                    free(self.stale.pop(shared.name).block)
+                return
+            entry = self.current.get(shared.path.resolve())
+            if entry is not None and entry.block.name == shared.name:
+                entry.users -= 1
+                self.evict()
+
+    def retire(self, entry: SharedBlock) -> None:
+        """Free a block that's been replaced, or set it aside until it's unused."""
+        if entry.users == 0:
+            free(entry.block)
+        else:
+            self.stale[entry.block.name] = entry
+
+    def evict(self) -> None:
+        """Free unused blocks, least recently used first, until they fit the limit."""
+        unused = [(key, e) for key, e in self.current.items() if e.users == 0]
+        unused_bytes = sum(entry.size for _, entry in unused)
+        for key, entry in unused:
+            if self.max_bytes is not None and unused_bytes <= self.max_bytes:
+                break
+            free(self.current.pop(key).block)
+            unused_bytes -= entry.size
+
+    def close(self) -> None:
+        """Free every block."""
+        with self.lock:
+            for entry in [*self.current.values(), *self.stale.values()]:
+                free(entry.block)
+            self.current.clear()
+            self.stale.clear()
+
+
+def load_block(path: Path, mtime_ns: int) -> SharedBlock:
+    """Read a file into a new shared memory block."""
+    data = path.read_bytes()
+    # Zero sized blocks aren't allowed
+    block = SharedMemory(create=True, size=max(len(data), 1))
+    block.buf[: len(data)] = data
+    return SharedBlock(block, len(data), mtime_ns)
+
+
+def free(block: SharedMemory) -> None:
+    """Close and remove a shared memory block."""
+    block.close()
+    block.unlink()
+
+
+# Blocks that couldn't be closed after a job because views of them were still alive
+_lingering: list[SharedMemory] = []
+
+
+@contextmanager
+def attach(shared: SharedInput) -> Iterator[memoryview]:
+    """Map a shared input into a worker process for the length of a job.
+
+    The mapping is closed afterwards, so a worker doesn't keep every input it has
+    seen mapped, where it would count against its memory budget.
+    """
+    block = SharedMemory(name=shared.name)
+    view = block.buf[: shared.size].toreadonly()
+    try:
+        yield view
+    finally:
+        view.release()
+        _lingering.append(block)
+        close_lingering()
+
+
+def close_lingering() -> None:
+    """Close every block that no longer has views of it."""
+    for block in list(_lingering):
+        try:
+            block.close()
+        except BufferError:
+            continue
+        _lingering.remove(block)
+
+
+class SharedInputFile(io.RawIOBase):
+    """A binary file reading from a view of shared memory.
+
+    Readers that ask for the whole buffer with getbuffer (like utils.parse.map_input)
+    get the view itself rather than a copy.
+    """
+
+    def __init__(self, view: memoryview) -> None:
+        """Initialize from a view of the input."""
+        super().__init__()
+        self.view = view
+        self.position = 0
+
+    def readable(self) -> bool:
+        """Report that the file can be read."""
+        return True
+
+    def getbuffer(self) -> memoryview:
+        """Get the whole input without copying it."""
+        return self.view[:]
+
+    def readinto(self, buffer: Any) -> int:
+        """Read the next chunk of the input into a buffer."""
+        chunk = self.view[self.position : self.position + len(buffer)]
+        buffer[: len(chunk)] = chunk
+        self.position += len(chunk)
+        return len(chunk)
+
+    def readline(self, size: int | None = -1) -> bytes:
+        """Read up to and including the next newline."""
+        newline = NEWLINE_PATTERN.search(self.view, self.position)
+        end = newline.end() if newline is not None else len(self.view)
+        if size is not None and size >= 0:
+            end = min(end, self.position + size)
+        line = bytes(self.view[self.position : end])
+        self.position = end
+        return line
+
+
+@contextmanager
+def open_shared(module: ModuleType, source: Path | SharedInput) -> Iterator[IO[Any]]:
+    """Open an input file or a shared input in the mode a solution expects."""
+    if isinstance(source, Path):
+        with open_input(module, source) as fin:
+            yield fin
+        return
+    with attach(source) as view:
+        if reads_bytes(module):
+            with SharedInputFile(view) as fin:
+                yield fin
+        else:
+            yield io.StringIO(str(view, "utf-8"))
+
+
+def source_path(source: Path | SharedInput) -> Path:
+    """Get the file an input file or a shared input was loaded from."""
+    return source.path if isinstance(source, SharedInput) else source
@@ -0,0 +1,85 @@
+"""Helpers for measuring the time and memory used by each part of a solution."""
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from time import perf_counter, process_time
+from typing import Any, Iterator
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+@dataclass
+class PartUsage:
+    """The resources used while computing one part."""
+
+    wall_time: float
+    cpu_time: float
+    peak_memory: int
+    top_allocations: list[str] = field(default_factory=list)
+    max_rss: int | None = None
+
+
+def get_max_rss() -> int | None:
+    """Get the maximum resident set size of the process in bytes, if available."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, everywhere else reports kilobytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def measure_part(iterator: Iterator[Any], top: int = 5) -> tuple[Any, PartUsage]:
+    """Get the next answer from a solution, measuring the resources it used.
+
+    Memory is traced with tracemalloc, which slows the solution down, so the times
+    reported are only useful to compare against other traced runs.
+    """
+    tracemalloc.start()
+    try:
+        start_wall = perf_counter()
+        start_cpu = process_time()
+        answer = next(iterator, None)
+        wall_time = perf_counter() - start_wall
+        cpu_time = process_time() - start_cpu
+
+        _, peak_memory = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, __file__)]
+        )
+    finally:
+        tracemalloc.stop()
+
+    top_allocations = [
+        f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}: "
+        f"{format_bytes(stat.size)} in {stat.count} blocks"
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+    usage = PartUsage(wall_time, cpu_time, peak_memory, top_allocations, get_max_rss())
+    return answer, usage
+
+
+def format_bytes(size: float) -> str:
+    """Format a number of bytes in human readable units."""
+    for unit in ["B", "KiB", "MiB"]:
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def format_usage(usage: PartUsage) -> str:
+    """Format the resources used by a part."""
+    lines = [
+        f"  Wall time: {usage.wall_time:.4f}s",
+        f"  CPU time: {usage.cpu_time:.4f}s",
+        f"  Peak traced memory: {format_bytes(usage.peak_memory)}",
+    ]
+    if usage.max_rss is not None:
+        lines.append(f"  Max RSS: {format_bytes(usage.max_rss)}")
+    if usage.top_allocations:
+        lines.append("  Top allocations still held:")
+        lines.extend(f"    {allocation}" for allocation in usage.top_allocations)
+    return "\n".join(lines)
@@ -0,0 +1,6 @@
+"""Benchmark for Day {{cookiecutter.day}}, run with python -m day{{cookiecutter.day}}.bench."""
+
+from driver import cli
+
+if __name__ == "__main__":
+    cli(["bench", "{{cookiecutter.day}}"])
@@ -0,0 +1,8 @@
+"""Synthetic input generator for Day {{cookiecutter.day}}."""
+
+from random import Random
+
+
+def generate(scale: int, rng: Random) -> str:
+    """Generate an input whose size grows linearly with scale."""
+    raise NotImplementedError("No generator for Day {{cookiecutter.day}} yet")
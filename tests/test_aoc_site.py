@@ -0,0 +1,125 @@
+"""Tests for downloading inputs, against a local stand-in for the AOC website."""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from driver_helpers import aoc_site
+
+YEAR = 2023
+INPUTS = {
+    aoc_site.INPUT_PATH.format(year=YEAR, day=1): b"1abc2\npqr3stu8vwx\n",
+    aoc_site.INPUT_PATH.format(year=YEAR, day=2): b"Game 1: 3 blue\n",
+}
+TOKEN = "test-token"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves the inputs in INPUTS to requests carrying the session cookie."""
+
+    requests: list[str] = []
+
+    def do_GET(self) -> None:
+        """Serve an input, or a 404 for any other path."""
+        self.requests.append(self.path)
+        content = INPUTS.get(self.path)
+        if content is None or f"session={TOKEN}" not in self.headers["Cookie"]:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Keep the test output quiet."""
+
+
+@pytest.fixture
+def base_url() -> Iterator[str]:
+    """Run the stand-in site on a free port for the length of a test."""
+    StandInHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def session_token(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Provide the session token through config.json, with fresh lookups."""
+    (tmp_path / "config.json").write_text(json.dumps({"Session": TOKEN}))
+    monkeypatch.chdir(tmp_path)
+    aoc_site.get_session_token.cache_clear()
+    aoc_site.get_http_session.cache_clear()
+    yield
+    aoc_site.get_session_token.cache_clear()
+    aoc_site.get_http_session.cache_clear()
+
+
+def test_cache_miss_then_hit(tmp_path: Path, base_url: str) -> None:
+    """The first download goes to the site, and the second comes from the cache."""
+    cache_dir = tmp_path / "cache"
+
+    content = aoc_site.get_problem_input(YEAR, 1, cache_dir, base_url)
+    assert content == INPUTS["/2023/day/1/input"]
+    assert StandInHandler.requests == ["/2023/day/1/input"]
+
+    content = aoc_site.get_problem_input(YEAR, 1, cache_dir, base_url)
+    assert content == INPUTS["/2023/day/1/input"]
+    assert StandInHandler.requests == ["/2023/day/1/input"]
+
+
+def test_missing_input_is_reported(tmp_path: Path, base_url: str) -> None:
+    """A 404 raises, without caching anything."""
+    import requests
+
+    with pytest.raises(requests.HTTPError):
+        aoc_site.get_problem_input(YEAR, 3, tmp_path / "cache", base_url)
+    assert aoc_site.InputCache(tmp_path / "cache").get(YEAR, 3) is None
+
+
+def test_write_atomic_replaces_whole_file(tmp_path: Path) -> None:
+    """Writing over a file leaves only the new contents, and no temporary file."""
+    path = tmp_path / "nested" / "input"
+    aoc_site.write_atomic(path, b"old contents that are longer\n")
+    aoc_site.write_atomic(path, b"new\n")
+    assert path.read_bytes() == b"new\n"
+    # The temporary file is renamed into place, not left beside it
+    assert [p.name for p in path.parent.iterdir()] == ["input"]
+
+
+def test_prefetch_resolves_session_once(
+    tmp_path: Path, base_url: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Concurrent downloads share one token lookup and one HTTP session."""
+    lookups = []
+
+    def slow_firefox_session() -> str:
+        """Stand in for reading the cookie database, slowly."""
+        lookups.append(threading.get_ident())
+        time.sleep(0.1)
+        return TOKEN
+
+    # A slow lookup gives every download thread time to miss the cache
+    (tmp_path / "config.json").unlink()
+    monkeypatch.setattr(aoc_site, "get_firefox_session", slow_firefox_session)
+    paths = {day: tmp_path / f"day{day:02}" / "input" for day in (1, 2, 3)}
+    results = dict(
+        aoc_site.prefetch_inputs(paths, YEAR, 5, tmp_path / "cache", base_url)
+    )
+
+    assert results[1] is None and results[2] is None
+    assert results[3] is not None
+    assert paths[1].read_bytes() == INPUTS["/2023/day/1/input"]
+    assert not paths[3].exists()
+    assert len(lookups) == 1
+    assert aoc_site.get_http_session.cache_info().misses == 1
@@ -0,0 +1,64 @@
+"""Tests for the batch command, against a scratch day whose inputs misbehave."""
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from driver import cli
+from driver_helpers import budget
+
+SCRATCH_DAY = """
+import os
+import signal
+import time
+
+
+def run(file):
+    text = file.read()
+    if "crash" in text:
+        os._exit(1)
+    if "hang" in text:
+        # Blocking SIGALRM leaves only the wall-clock fallback
+        signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})
+        time.sleep(60)
+    yield len(text)
+    yield text.strip()
+"""
+
+
+@pytest.fixture
+def scratch_day(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Set up day 98 and a directory of its inputs, returning the directory."""
+    (tmp_path / "day98").mkdir()
+    (tmp_path / "day98" / "day98.py").write_text(SCRATCH_DAY)
+    inputs = tmp_path / "inputs"
+    inputs.mkdir()
+    for name in ("a", "crash", "hang", "b", "c"):
+        (inputs / name).write_text(f"{name}\n")
+    (tmp_path / "budgets.json").write_text(json.dumps({"default": {"timeout": 1}}))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(budget, "WALL_CLOCK_GRACE", 0.5)
+    return inputs
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_failures_leave_other_files_alone(scratch_day: Path, workers: int) -> None:
+    """A worker that dies or ignores its budget costs only its own file's line."""
+    result = CliRunner().invoke(cli, ["batch", "98", "inputs", "-w", str(workers)])
+
+    assert result.exit_code == 0, result.output
+    lines = {
+        Path(line["file"]).name: line
+        for line in map(json.loads, result.output.splitlines())
+    }
+    assert sorted(lines) == ["a", "b", "c", "crash", "hang"]
+    for name in ("a", "b", "c"):
+        assert lines[name]["answers"] == [2, name]
+    assert lines["crash"] == {
+        "file": str(Path("inputs") / "crash"),
+        "error": "The worker process died",
+        "over_budget": False,
+    }
+    assert lines["hang"]["over_budget"] is True
@@ -0,0 +1,87 @@
+"""A compact grid of characters stored in a flat array."""
+
+from typing import Iterable, Iterator, TextIO
+
+from utils.parse import read_lines
+
+BORDER = ord(" ")
+
+
+class Grid:
+    """A grid of characters stored in a flat bytearray, surrounded by a border.
+
+    Cells are addressed by a single int index rather than an (x, y) tuple. Moving
+    between cells is done by adding one of the direction offsets to an index, and
+    the border means a step off the edge lands on a cell holding the border value
+    rather than needing a bounds check.
+    """
+
+    def __init__(self, rows: Iterable[str], border: int = BORDER) -> None:
+        """Initialize from rows of equal length."""
+        row_list = list(rows)
+        self.width = len(row_list[0]) if row_list else 0
+        self.height = len(row_list)
+        self.stride = self.width + 2
+        self.border = border
+
+        edge = bytes([border]) * self.stride
+        self.data = bytearray(edge)
+        for row in row_list:
+            if len(row) != self.width:
+                raise ValueError("Grid rows must all be the same length")
+            self.data.append(border)
+            self.data.extend(row.encode("ascii"))
+            self.data.append(border)
+        self.data.extend(edge)
+
+        self.up = -self.stride
+        self.down = self.stride
+        self.left = -1
+        self.right = 1
+        self.directions = (self.up, self.right, self.down, self.left)
+
+    @classmethod
+    def from_file(cls, file: TextIO, border: int = BORDER) -> "Grid":
+        """Read a grid from a file, stopping at the first blank line."""
+        rows = []
+        for line in read_lines(file):
+            if not line:
+                break
+            rows.append(line)
+        return cls(rows, border)
+
+    def index(self, x: int, y: int) -> int:
+        """Get the index of the cell at (x, y)."""
+        return (y + 1) * self.stride + x + 1
+
+    def position(self, index: int) -> tuple[int, int]:
+        """Get the (x, y) position of the cell at an index."""
+        y, x = divmod(index, self.stride)
+        return (x - 1, y - 1)
+
+    def __getitem__(self, index: int) -> int:
+        """Get the value of the cell at an index."""
+        return self.data[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        """Set the value of the cell at an index."""
+        self.data[index] = value
+
+    def in_bounds(self, index: int) -> bool:
+        """Check if an index is inside the grid rather than on the border."""
+        return self.data[index] != self.border
+
+    def cells(self) -> Iterator[int]:
+        """Iterate over the indices of every cell inside the grid."""
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def find(self, value: str) -> int:
+        """Find the index of the first cell holding a value."""
+        return self.data.index(ord(value))
+
+    def row(self, y: int) -> bytes:
+        """Get a row of the grid."""
+        start = self.index(0, y)
+        return bytes(self.data[start : start + self.width])
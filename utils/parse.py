@@ -1,8 +1,159 @@
 """Helper functions for parsing input."""
-from typing import Iterator, TextIO
+import io
+import mmap
+import re
+from array import array
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, BinaryIO, Iterator, Sequence, TextIO
+
+if TYPE_CHECKING:
+    import numpy as np
+
+Buffer = bytes | bytearray | mmap.mmap | memoryview
+
+NEWLINE_PATTERN = re.compile(rb"\n")
+
+BYTES_INT_PATTERN = re.compile(rb"-?\d+")
+DIGIT_PATTERN = re.compile(rb"\d")
+# Ints that might not fit in 64 bits, and minus signs that aren't at the start of a
+# number, which NumPy can't tokenize the same way as BYTES_INT_PATTERN
+NON_NUMPY_PATTERN = re.compile(rb"\d{19}|-(?!\d)|\d-")
+# Keeps the bytes that make up ints and turns every other byte into a space
+SEPARATOR_TABLE = bytes(c if c in b"-0123456789" else ord(" ") for c in range(256))
 
 
 def read_lines(file: TextIO) -> Iterator[str]:
     """Read lines from a file, stripping newlines."""
     for line in file:
         yield line.strip("\r\n")
+
+
+@contextmanager
+def map_input(file: BinaryIO) -> Iterator[Buffer]:
+    """Memory map a binary file, falling back to reading it for in-memory files.
+
+    Files that already hold their contents in memory (anything with a getbuffer
+    method, such as BytesIO) are used without copying. Any memoryviews taken of the
+    buffer must be released before the block exits.
+    """
+    getbuffer = getattr(file, "getbuffer", None)
+    if getbuffer is not None:
+        with getbuffer() as view:
+            yield view
+        return
+    try:
+        fileno = file.fileno()
+    except (OSError, io.UnsupportedOperation):
+        yield file.read()
+        return
+    try:
+        mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        # Empty files can't be mapped
+        yield b""
+        return
+    with mapped:
+        yield mapped
+
+
+def iter_buffer_lines(buffer: Buffer) -> Iterator[memoryview]:
+    """Iterate over the lines of a buffer as zero-copy memoryviews, without newlines."""
+    view = memoryview(buffer)
+    start = 0
+    for newline in NEWLINE_PATTERN.finditer(buffer):
+        end = newline.start()
+        if end > start and view[end - 1] == ord("\r"):
+            end -= 1
+        yield view[start:end]
+        start = newline.end()
+    if start < len(view):
+        yield view[start:]
+
+
+def iter_line_chunks(
+    buffer: Buffer, chunk_size: int = 1 << 20
+) -> Iterator[tuple[int, int]]:
+    """Split a buffer into spans of about chunk_size bytes that end at line breaks.
+
+    The start and end of each span can be passed as pos and endpos to compiled
+    patterns, so whole lines can be matched a chunk at a time without copying.
+    """
+    start = 0
+    while start < len(buffer):
+        newline = NEWLINE_PATTERN.search(buffer, min(start + chunk_size, len(buffer)))
+        end = newline.end() if newline is not None else len(buffer)
+        yield start, end
+        start = end
+
+
+def split_lines(buffer: Buffer) -> list[bytes]:
+    """Split a whole buffer into lines in one go, without newlines.
+
+    Anything other than bytes (such as a memory map) is copied into one bytes object
+    first, and every line is a copy too, so this holds about twice the input. Use
+    iter_buffer_lines to go through the lines of a large input without copying.
+    """
+    data = buffer if isinstance(buffer, bytes) else bytes(buffer)
+    return data.splitlines()
+
+
+def read_chunked_lines(file: BinaryIO, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+    """Stream lines from a binary file in fixed size chunks, without newlines.
+
+    Only one chunk (plus any partial line carried over) is held in memory at a time.
+    """
+    remainder = b""
+    while chunk := file.read(chunk_size):
+        lines = (remainder + chunk).splitlines(keepends=True)
+        remainder = b""
+        if not lines[-1].endswith(b"\n"):
+            remainder = lines.pop()
+        for line in lines:
+            yield line.rstrip(b"\r\n")
+    if remainder:
+        yield remainder.rstrip(b"\r")
+
+
+def ints(data: str | Buffer) -> Sequence[int]:
+    """Find every signed int in a line or a whole buffer.
+
+    Separators are turned into spaces and NumPy tokenizes the rest in C, straight
+    into an array("q") with no object per int. Without NumPy, or with an int too
+    wide for 64 bits, the ints are found with a regex and returned as a list of
+    Python ints instead.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    text = bytes(data).translate(SEPARATOR_TABLE)
+    values = array("q")
+    if DIGIT_PATTERN.search(text) is None:
+        # NumPy reads a string of only spaces as a single 0
+        return values
+    if NON_NUMPY_PATTERN.search(text) is None:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            parsed = np.fromstring(text, dtype=np.int64, sep=" ")
+            values.frombytes(memoryview(parsed).cast("B"))
+            return values
+    return [int(token) for token in BYTES_INT_PATTERN.findall(text)]
+
+
+def int_columns(data: str | Buffer, columns: int) -> list[Sequence[int]]:
+    """Split the ints of an input with a fixed number of ints per line into columns.
+
+    For example, lines like "1,2,3~4,5,6" give six arrays, one per position.
+    """
+    values = ints(data)
+    if len(values) % columns:
+        raise ValueError(f"Expected a multiple of {columns} ints, got {len(values)}")
+    return [values[column::columns] for column in range(columns)]
+
+
+def to_numpy(values: array) -> "np.ndarray":
+    """View an array of ints as a NumPy array without copying."""
+    import numpy as np
+
+    return np.frombuffer(values, dtype=np.int64)